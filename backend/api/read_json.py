@@ -1,4 +1,4 @@
-import json
+import orjson
 import os
 import pandas as pd
 import re
@@ -6,7 +6,8 @@ from backend.services.config_loader import load_config
 
 config = load_config()
 
-data_dir = None
+# Resolved once at import; abspath costs a stat chain per call
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 file_heading = "file"
 time_heading = "time"
@@ -15,26 +16,60 @@ co2_heading = "co2"
 o2_heading = "o2"
 thermal_heading = "thermal energy output"
 
+# compiled once rather than per sort comparison
+_file_number = re.compile(r'\d+')
+
 
 def get_sorted_json_filepaths():
     """
     Returns a numerically sorted list of JSON file paths in the dummy_data directory.
     """
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    data_dir = os.path.join(script_dir, "..", config['data_path'])
-    filenames = sorted(
-        os.listdir(data_dir),
-        key=lambda x: int(re.search(r'\d+', x).group())
-    )
-    return [os.path.join(data_dir, filename) for filename in filenames]
+    data_dir = os.path.join(_SCRIPT_DIR, "..", config['data_path'])
+
+    # scandir gives the path without an extra stat per file, and pairing
+    # each path with its number up front means one regex match per file
+    # instead of one per comparison
+    numbered = [
+        (int(_file_number.search(entry.name).group()), entry.path)
+        for entry in os.scandir(data_dir)
+    ]
+    numbered.sort()
+    return [path for _, path in numbered]
+
+
+def get_jsonl_path():
+    """
+    Returns the path of the combined JSONL data file for the run.
+    """
+    return os.path.join(_SCRIPT_DIR, "..", config['data_path'], config['data_filename'])
+
+
+def extract_rows_from_jsonl(file_path):
+    """
+    Streams a JSONL file and returns one heading-mapped dictionary per line.
+    """
+    rows = []
+    with open(file_path, 'rb') as file:
+        for i, line in enumerate(file, start=1):
+            file_data = orjson.loads(line)
+            rows.append({
+                file_heading: f"{i}.json",
+                time_heading: file_data.get("time"),
+                temp_heading: file_data.get("temperature"),
+                co2_heading: file_data.get("co2"),
+                o2_heading: file_data.get("o2"),
+                thermal_heading: file_data.get("thermal")
+            })
+    return rows
 
 
 def extract_row_from_json(file_path):
     """
     Loads a JSON file and returns a dictionary mapping the required headings.
     """
-    with open(file_path, 'r') as file:
-        file_data = json.load(file)
+    # orjson parses in C, several times faster than the stdlib json module
+    with open(file_path, 'rb') as file:
+        file_data = orjson.loads(file.read())
         filename = os.path.basename(file_path)
         file_data['file'] = filename
         return {
@@ -1,65 +1,106 @@
-import os
-import shutil
-from backend.simulation.process_model import process_for_dataframe, process_for_sql
-from backend.services.data_processor import initialise_db, initialise_dataframe
-from backend.services.database import delete_db
-from backend.services.display_db import start_server, plot_data_from_db
-from backend.services.config_loader import load_config
-import sys
-
-config = load_config()
-
-database_type = config["database_type"]
-
-script_dir = os.path.dirname(os.path.abspath(__file__))
-data_path = os.path.join(script_dir, config['data_path'])
-db_path = os.path.join(script_dir, config['database_name'])
-
-
-def delete_pycache_dirs():
-    """
-    Task: Remove all pycache directories for cleaner look after running code.
-    """
-    for dirpath, dirnames, filenames in os.walk("."):
-        for dirname in dirnames:
-            if dirname == "__pycache__":
-                full_path = os.path.join(dirpath, dirname)
-                shutil.rmtree(full_path)
-            
-
-def delete_data():
-    """
-    Task: Delete all data that has been generated
-    """
-    for filename in os.listdir(data_path):
-        os.remove(os.path.join(data_path, filename))
-
-
-if __name__ == "__main__":
-    """
-    Tasks: - Run the simulation to either produce data for a dataframe or SQL table.
-           - Clean the project.
-    """
-
-    if sys.version_info < (3, 10):
-        raise RuntimeError("Python 3.10 or newer is required")
-
-    os.system('cls')
-
-    # Create a dataframe from all of the experimental data
-    if database_type == "dataframe":
-        process_for_dataframe()
-        data = initialise_dataframe()
-        print(data)
-    else:
-        # Create an SQL table of the data by default
-        process_for_sql()
-        initialise_db()
-        start_server()
-
-    plot_data_from_db()
-
-    # Clean the project
-    delete_data()
-    delete_pycache_dirs()
+import os
+import shutil
+import subprocess
+from backend.simulation.process_model import process_for_dataframe, process_for_sql
+from backend.services.data_processor import initialise_db, initialise_dataframe
+from backend.services.database import delete_db
+from backend.services.display_db import start_server, plot_data_from_db
+from backend.services.config_loader import load_config
+import sys
+
+config = load_config()
+
+database_type = config["database_type"]
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+data_path = os.path.join(script_dir, config['data_path'])
+db_path = os.path.join(script_dir, config['database_name'])
+
+
+# directories that never hold project bytecode; descending into them
+# (VCS objects, vendored packages, virtualenvs) would dominate the scan
+# on real checkouts
+_SKIP_DIRS = frozenset({".git", ".venv", "node_modules", ".mypy_cache"})
+
+
+def _remove_dirs(paths):
+    """
+    Removes whole directory trees. One rm -rf subprocess handles the
+    whole batch in native code where available; otherwise each tree
+    falls back to Python-level rmtree.
+    """
+    if os.name == "posix" and shutil.which("rm"):
+        subprocess.run(["rm", "-rf", "--", *paths], check=False)
+    else:
+        for path in paths:
+            shutil.rmtree(path, ignore_errors=True)
+
+
+def delete_pycache_dirs(root="."):
+    """
+    Task: Remove all pycache directories for cleaner look after running code.
+    """
+    # scandir reads each entry's type straight from the directory
+    # record, so the walk costs one syscall per directory and never
+    # stats individual files; matched directories are collected whole
+    # without descending into them, then removed as one batch
+    hits = []
+
+    def _scan(path):
+        with os.scandir(path) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name == "__pycache__":
+                    hits.append(entry.path)
+                elif entry.name not in _SKIP_DIRS:
+                    _scan(entry.path)
+
+    _scan(root)
+    if hits:
+        _remove_dirs(hits)
+
+
+
+def delete_data():
+    """
+    Task: Delete all data that has been generated
+    """
+    # scandir streams entries with their type and a ready-made path, so
+    # each deletion skips the per-file join and the stat that the
+    # listdir loop paid
+    with os.scandir(data_path) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False):
+                os.unlink(entry.path)
+
+
+if __name__ == "__main__":
+    """
+    Tasks: - Run the simulation to either produce data for a dataframe or SQL table.
+           - Clean the project.
+    """
+
+    if sys.version_info < (3, 10):
+        raise RuntimeError("Python 3.10 or newer is required")
+
+    os.system('cls')
+
+    # Create a dataframe from all of the experimental data
+    if database_type == "dataframe":
+        process_for_dataframe()
+        data = initialise_dataframe()
+        print(data)
+    else:
+        # Create an SQL table of the data by default.
+        # process_for_sql inserts straight into the database,
+        # so there is no JSON round trip to load afterwards.
+        process_for_sql()
+        start_server()
+
+    plot_data_from_db()
+
+    # Clean the project
+    delete_data()
+    delete_pycache_dirs()
     delete_db()
\ No newline at end of file
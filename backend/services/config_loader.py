@@ -1,8 +1,18 @@
-import os
-import yaml
-
-CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'config.yaml')
-
-def load_config():
-    with open(CONFIG_PATH, 'r') as f:
-        return yaml.safe_load(f) 
\ No newline at end of file
+import os
+import yaml
+from functools import lru_cache
+
+try:
+    # libyaml C bindings, roughly an order of magnitude faster to parse
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'config.yaml')
+
+@lru_cache(maxsize=1)
+def load_config():
+    # every module calls this at import time, so parse the file once
+    # and serve the cached dict afterwards
+    with open(CONFIG_PATH, 'r') as f:
+        return yaml.load(f, Loader=_Loader)
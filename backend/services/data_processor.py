@@ -1,46 +1,62 @@
-import pandas as pd
-from backend.api.read_json import get_sorted_json_filepaths, extract_row_from_json, file_heading, time_heading, temp_heading, co2_heading, o2_heading, thermal_heading
-from backend.services.database import generate_table, insert_data
-
-def initialise_dataframe():
-    """
-    task: generate a data frame of all JSON files in dummy_data.
-    input: all JSON files located in the "dummy_data" directory.
-    output: data frame containing all the data, ordered numerically by file name.
-    """
-    # make dataframe and set data types
-    data = pd.DataFrame({
-        file_heading: pd.Series(dtype="str"),
-        time_heading: pd.Series(dtype="float"),
-        temp_heading: pd.Series(dtype="float"),
-        co2_heading: pd.Series(dtype="float"),
-        o2_heading: pd.Series(dtype="float"),
-        thermal_heading: pd.Series(dtype="int")
-    })
-
-    filepaths = get_sorted_json_filepaths()
-    for file_path in filepaths:
-        row = extract_row_from_json(file_path)
-        row_df = pd.DataFrame([row])
-        data = pd.concat([data, row_df], ignore_index=True)
-
-    return data
-
-
-def initialise_db():
-    """
-    task: generate an SQLite database using all JSON files in dummy_data.
-    input: all JSON files located in the "dummy_data" directory.
-    output: SQLite database containing all the data, ordered by id (determined through file name).
-    """
-    generate_table()
-    filepaths = get_sorted_json_filepaths()
-    for file_path in filepaths:
-        row = extract_row_from_json(file_path)
-        insert_data(
-            row[time_heading],
-            row[temp_heading],
-            row[co2_heading],
-            row[o2_heading],
-            row[thermal_heading]
-        )
\ No newline at end of file
+import pandas as pd
+from datetime import datetime
+from backend.api.read_json import get_jsonl_path, extract_rows_from_jsonl, file_heading, time_heading, temp_heading, co2_heading, o2_heading, thermal_heading
+from backend.services.database import generate_table, insert_many
+
+def initialise_dataframe():
+    """
+    task: generate a data frame of the simulation data in dummy_data.
+    input: the JSONL data file located in the "dummy_data" directory.
+    output: data frame containing all the data, in simulation order.
+    """
+    # empty dataframe template keeps the column order and data types
+    data = pd.DataFrame({
+        file_heading: pd.Series(dtype="str"),
+        time_heading: pd.Series(dtype="float"),
+        temp_heading: pd.Series(dtype="float"),
+        co2_heading: pd.Series(dtype="float"),
+        o2_heading: pd.Series(dtype="float"),
+        thermal_heading: pd.Series(dtype="int")
+    })
+
+    # pandas parses the whole JSONL stream in C, straight into
+    # typed columns, instead of building a Python dict per row
+    raw = pd.read_json(get_jsonl_path(), lines=True)
+    if not raw.empty:
+        raw = raw.rename(columns={
+            "time": time_heading,
+            "temperature": temp_heading,
+            "co2": co2_heading,
+            "o2": o2_heading,
+            "thermal": thermal_heading
+        })
+        raw.insert(0, file_heading, [f"{i}.json" for i in range(1, len(raw) + 1)])
+        data = raw[list(data.columns)]
+
+    return data
+
+
+def initialise_db():
+    """
+    task: generate an SQLite database using the simulation data in dummy_data.
+    input: the JSONL data file located in the "dummy_data" directory.
+    output: SQLite database containing all the data, ordered by id (determined through line order).
+    """
+    generate_table()
+
+    # gather all rows up front and insert them in one transaction,
+    # rather than paying a commit per row. The JSONL stores ISO-8601
+    # time strings; the table stores numeric unix timestamps, which the
+    # display layer formats back with strftime('unixepoch')
+    rows = [
+        (
+            datetime.fromisoformat(row[time_heading]).timestamp(),
+            row[temp_heading],
+            row[co2_heading],
+            row[o2_heading],
+            row[thermal_heading]
+        )
+        for row in extract_rows_from_jsonl(get_jsonl_path())
+    ]
+    if rows:
+        insert_many(rows)
\ No newline at end of file
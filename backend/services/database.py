@@ -1,43 +1,91 @@
-import sqlite3
-import os
-from backend.services.config_loader import load_config
-import matplotlib.pyplot as plt
-from datetime import datetime
-
-config = load_config()
-
-# Get the absolute path to the backend directory
-BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-DB_PATH = os.path.join(BACKEND_DIR, config['database_name'])
-
-conn = sqlite3.connect(DB_PATH)
-cur = conn.cursor()
-
-def generate_table():
-    cur.execute("""
-    CREATE TABLE IF NOT EXISTS experimental_data (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        time TEXT NOT NULL,
-        temperature FLOAT NOT NULL,
-        co2 FLOAT NOT NULL,
-        o2 FLOAT NOT NULL,
-        thermal FLOAT NOT NULL
-        );
-                """)
-    conn.commit()
-
-
-def insert_data(time,temp,co2,o2,thermal):
-    cur.execute("""
-        INSERT INTO experimental_data
-        (time, temperature, co2, o2, thermal)
-        VALUES (?, ?, ?, ?, ?)""",
-        (time, temp, co2, o2, thermal))
-    conn.commit()
- 
-
-def delete_db():
-    cur.close()
-    conn.close()
-    if os.path.exists(DB_PATH):
-        os.remove(DB_PATH)
+import sqlite3
+import os
+from functools import lru_cache
+from backend.services.config_loader import load_config
+import matplotlib.pyplot as plt
+from datetime import datetime
+
+config = load_config()
+
+# Get the absolute path to the backend directory
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DB_PATH = os.path.join(BACKEND_DIR, config['database_name'])
+
+
+@lru_cache(maxsize=1)
+def get_conn():
+    """
+    Opens the shared database connection on first use. Connecting
+    lazily means processes that import this module without touching
+    the database never pay for the file handle, and delete_db can
+    drop the cache so the file is actually freed.
+    """
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+
+    # Speed up bulk inserts: WAL avoids the rollback journal and
+    # synchronous=NORMAL skips the fsync on every commit. page_size only
+    # takes effect on new database files, so it runs before WAL is set.
+    # mmap_size lets the display/plot scans read pages straight from the
+    # OS page cache instead of through read() calls.
+    conn.executescript("""
+        PRAGMA page_size=8192;
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-65536;
+        PRAGMA mmap_size=268435456;
+    """)
+
+    return conn
+
+
+def generate_table():
+    conn = get_conn()
+    # WITHOUT ROWID stores the rows directly in the primary key btree,
+    # dropping the separate rowid index a normal table maintains
+    # time is stored as a numeric unix timestamp: 8 fixed bytes per row
+    # instead of variable-length isoformat text, formatted only at
+    # display time
+    conn.execute("""
+    CREATE TABLE IF NOT EXISTS experimental_data (
+        id INTEGER PRIMARY KEY,
+        time REAL NOT NULL,
+        temperature FLOAT NOT NULL,
+        co2 FLOAT NOT NULL,
+        o2 FLOAT NOT NULL,
+        thermal FLOAT NOT NULL
+        ) WITHOUT ROWID;
+                """)
+    conn.commit()
+
+
+def insert_data(time,temp,co2,o2,thermal):
+    conn = get_conn()
+    # WITHOUT ROWID tables don't auto-assign ids, so the next id comes
+    # from the primary key btree (a single index lookup)
+    conn.execute("""
+        INSERT INTO experimental_data
+        (id, time, temperature, co2, o2, thermal)
+        VALUES ((SELECT IFNULL(MAX(id), 0) + 1 FROM experimental_data), ?, ?, ?, ?, ?)""",
+        (time, temp, co2, o2, thermal))
+    conn.commit()
+
+
+def insert_many(rows):
+    conn = get_conn()
+    # insert all rows in a single transaction so the database
+    # only has to sync to disk once instead of once per row;
+    # sequential ids keep every insert an append to the btree
+    with conn:
+        conn.executemany("""
+            INSERT INTO experimental_data
+            (id, time, temperature, co2, o2, thermal)
+            VALUES ((SELECT IFNULL(MAX(id), 0) + 1 FROM experimental_data), ?, ?, ?, ?, ?)""",
+            rows)
+
+
+def delete_db():
+    get_conn().close()
+    get_conn.cache_clear()
+    if os.path.exists(DB_PATH):
+        os.remove(DB_PATH)
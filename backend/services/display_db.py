@@ -1,92 +1,171 @@
-from flask import Flask, render_template_string
-import sqlite3
-import os
-import matplotlib.pyplot as plt
-from datetime import datetime
-from backend.services.config_loader import load_config
-from backend.services.database import conn, cur
-
-config = load_config()
-
-app = Flask(__name__)
-
-HTML = """
-<!doctype html>
-<title>Simulation Data</title>
-<h1>Experimental Data</h1>
-<table border=1>
-  <tr><th>ID</th><th>Time</th><th>Temperature</th><th>CO2</th><th>O2</th><th>Thermal</th></tr>
-  {% for row in data %}
-  <tr>
-    <td>{{ row[0] }}</td>
-    <td>{{ row[1] }}</td>
-    <td>{{ row[2] }}</td>
-    <td>{{ row[3] }}</td>
-    <td>{{ row[4] }}</td>
-    <td>{{ row[5] }}</td>
-  </tr>
-  {% endfor %}
-</table>
-"""
-
-@app.route("/")
-def index():
-    db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', config['database_name'])
-    conn = sqlite3.connect(db_path)
-    cur = conn.cursor()
-    cur.execute("SELECT * FROM experimental_data")
-    data = cur.fetchall()
-    conn.close()
-    return render_template_string(HTML, data=data)
-
-def start_server():
-    app.run(debug=False)
-
-
-def plot_data_from_db():
-    """
-    Fetches data from the experimental_data table and plots it.
-    """
-    # Fetch data
-    cur.execute("SELECT id, temperature, co2, o2, thermal FROM experimental_data")
-    rows = cur.fetchall()
-
-    # Unpack columns
-    id_list = [row[0] for row in rows]
-    temp_list = [row[1] for row in rows]
-    co2_list = [row[2] for row in rows]
-    o2_list = [row[3] for row in rows]
-    thermal_list = [row[4] for row in rows]
-
-    # Plotting
-    fig, ax = plt.subplots(2, 2, figsize=(14, 8))
-
-    ax[0, 0].plot(id_list, temp_list, 'r-', label='Temperature (degC)')
-    ax[0, 0].set_title("Temperature")
-    ax[0, 0].set_ylabel("degC")
-    ax[0, 0].legend()
-
-    ax[0, 1].plot(id_list, co2_list, 'g-', label='CO2 (ppm)')
-    ax[0, 1].set_title("CO2 Concentration")
-    ax[0, 1].set_ylabel("ppm")
-    ax[0, 1].set_ylim(0, max(co2_list) * 1.2)
-    ax[0, 1].legend()
-
-    ax[1, 0].plot(id_list, o2_list, 'b-', label='O2 (ppm)')
-    ax[1, 0].set_title("O2 Concentration")
-    ax[1, 0].set_ylabel("ppm")
-    ax[1, 0].set_ylim(0, max(o2_list) * 1.2)
-    ax[1, 0].legend()
-    
-
-    ax[1, 1].plot(id_list, thermal_list, 'b-', label='Thermal energy')
-    ax[1, 1].set_title("Thermal energy emitted")
-    ax[1, 1].set_ylabel("Joules")
-    ax[1, 1].legend()
-
-    for a in ax.flatten():
-        a.set_xlabel("Time since start (minutes)")
-        a.tick_params(axis='x', rotation=45)
-
-    plt.tight_layout()
-    plt.show()
\ No newline at end of file
+from flask import Flask
+import pandas as pd
+import matplotlib
+from backend.services.config_loader import load_config
+from backend.services.database import get_conn
+
+config = load_config()
+
+# Agg renders straight to a PNG without any GUI glue, which is much
+# faster for unattended runs; the backend must be picked before pyplot
+# is imported
+if config.get("headless_plots", False):
+    matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+
+app = Flask(__name__)
+
+_HEADER = """
+<!doctype html>
+<title>Simulation Data</title>
+<h1>Experimental Data</h1>
+<table border=1>
+  <tr><th>ID</th><th>Time</th><th>Temperature</th><th>CO2</th><th>O2</th><th>Thermal</th></tr>
+"""
+_FOOTER = "</table>\n"
+
+# the table rows leave sqlite already formatted: the cell concatenation
+# and timestamp formatting run in C inside the query instead of per-row
+# Python. Every cell is a number or a strftime timestamp, so the output
+# contains no characters that would need HTML escaping
+_ROW_SQL = (
+    "SELECT '  <tr><td>' || id"
+    " || '</td><td>' || strftime('%Y-%m-%dT%H:%M:%S', time, 'unixepoch', 'localtime')"
+    " || '</td><td>' || temperature"
+    " || '</td><td>' || co2"
+    " || '</td><td>' || o2"
+    " || '</td><td>' || thermal"
+    " || '</td></tr>'"
+    " FROM experimental_data"
+)
+
+
+def _render(rows):
+    """
+    Assembles the index page from pre-formatted ``<tr>`` strings.
+    """
+    return _HEADER + "\n".join(rows) + _FOOTER
+
+# rendered-page cache for index(): the table is append-only, so the
+# page only changes when the newest id moves
+_last_max_id = None
+_cached_html = None
+
+
+@app.route("/")
+def index():
+    global _last_max_id, _cached_html
+
+    # Reuse the shared database connection rather than paying a
+    # connect/close per request
+    conn = get_conn()
+
+    # checking the newest id is much cheaper than re-reading and
+    # re-rendering the whole table
+    max_id = conn.execute("SELECT MAX(id) FROM experimental_data").fetchone()[0]
+    if _cached_html is not None and max_id == _last_max_id:
+        return _cached_html
+
+    rows = conn.execute(_ROW_SQL).fetchall()
+    _cached_html = _render(row[0] for row in rows)
+    _last_max_id = max_id
+    return _cached_html
+
+def start_server():
+    app.run(debug=False)
+
+
+# line colours as pre-resolved RGBA tuples; matplotlib takes these
+# as-is instead of parsing a 'r-' style shorthand on every plot call
+_RED = (1.0, 0.0, 0.0, 1.0)
+_GREEN = (0.0, 0.5, 0.0, 1.0)
+_BLUE = (0.0, 0.0, 1.0, 1.0)
+
+# figure cache for plot_data_from_db: building axes, ticks and legends
+# is the expensive part of a matplotlib draw, so it happens once and
+# later calls push new data into the existing Line2D handles
+_FIG = None
+_AXES = None
+_LINES = None
+
+
+def plot_data_from_db():
+    """
+    Fetches data from the experimental_data table and plots it.
+    """
+    # Fetch data as one columnar read, so matplotlib gets contiguous
+    # NumPy arrays instead of per-row Python tuples
+    df = pd.read_sql_query("SELECT id, temperature, co2, o2, thermal FROM experimental_data", get_conn())
+
+    # column views over the frame's buffers, no per-row boxing
+    id_list = df["id"].to_numpy()
+    temp_list = df["temperature"].to_numpy()
+    co2_list = df["co2"].to_numpy()
+    o2_list = df["o2"].to_numpy()
+    thermal_list = df["thermal"].to_numpy()
+
+    # Plotting: the first call builds the figure, titles, legends and
+    # layout; later calls only push the new data into the existing
+    # Line2D handles and rescale
+    global _FIG, _AXES, _LINES
+    if _FIG is None:
+        _FIG, _AXES = plt.subplots(2, 2, figsize=(14, 8))
+        fig, ax = _FIG, _AXES
+
+        _LINES = [
+            ax[0, 0].plot(id_list, temp_list, color=_RED, linestyle='-', label='Temperature (degC)')[0],
+            ax[0, 1].plot(id_list, co2_list, color=_GREEN, linestyle='-', label='CO2 (ppm)')[0],
+            ax[1, 0].plot(id_list, o2_list, color=_BLUE, linestyle='-', label='O2 (ppm)')[0],
+            ax[1, 1].plot(id_list, thermal_list, color=_BLUE, linestyle='-', label='Thermal energy')[0],
+        ]
+
+        ax[0, 0].set_title("Temperature")
+        ax[0, 0].set_ylabel("degC")
+        ax[0, 0].legend()
+
+        ax[0, 1].set_title("CO2 Concentration")
+        ax[0, 1].set_ylabel("ppm")
+        ax[0, 1].legend()
+
+        ax[1, 0].set_title("O2 Concentration")
+        ax[1, 0].set_ylabel("ppm")
+        ax[1, 0].legend()
+
+        ax[1, 1].set_title("Thermal energy emitted")
+        ax[1, 1].set_ylabel("Joules")
+        ax[1, 1].legend()
+
+        for a in ax.flatten():
+            a.set_xlabel("Time since start (minutes)")
+            a.tick_params(axis='x', rotation=45)
+
+        # fixed margins that fit the 2x2 grid at figsize (14, 8);
+        # hand-set once, they skip tight_layout's per-artist bounding-box
+        # measurement pass entirely
+        fig.subplots_adjust(left=0.07, right=0.98, top=0.94,
+                            bottom=0.1, wspace=0.22, hspace=0.35)
+    else:
+        fig, ax = _FIG, _AXES
+
+        series = (temp_list, co2_list, o2_list, thermal_list)
+        axes = (ax[0, 0], ax[0, 1], ax[1, 0], ax[1, 1])
+        for line, ys, a in zip(_LINES, series, axes):
+            line.set_data(id_list, ys)
+            a.relim()
+            a.autoscale_view()
+
+    # data-dependent limits are recomputed on every call; one fused
+    # reduction over the two columns instead of two separate passes
+    co2_ylim, o2_ylim = df[["co2", "o2"]].to_numpy().max(axis=0) * 1.2
+    ax[0, 1].set_ylim(0, co2_ylim)
+    ax[1, 0].set_ylim(0, o2_ylim)
+    if config.get("headless_plots", False):
+        # savefig flushes the canvas through Agg's C renderer instead of
+        # blocking on an interactive window; the figure stays open so
+        # the next call can reuse it
+        fig.savefig("simulation_plots.png")
+    elif matplotlib.get_backend().lower() != "agg":
+        # under Agg show() is a no-op that still walks the figure
+        # manager, so only call it when a real GUI backend is active
+        plt.show()
\ No newline at end of file
@@ -1,17 +1,40 @@
-import json
-import os
-import sys
-sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'services'))
-from backend.services.config_loader import load_config
-
-config = load_config()
-
-def write_json(data, filename):
-    # Use config for dummy_data folder
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    dummy_data_dir = os.path.join(script_dir, '..', config['data_path'])
-    os.makedirs(dummy_data_dir, exist_ok=True)
-    file_path = os.path.join(dummy_data_dir, f"{filename}.json")
-    with open(file_path, "w") as f:
-        json.dump(data, f, indent=2)
-        
\ No newline at end of file
+import json
+import orjson
+import os
+import sys
+
+# Resolved once at import; abspath costs a stat chain per call
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(_SCRIPT_DIR, '..', 'services'))
+from backend.services.config_loader import load_config
+
+config = load_config()
+
+def get_data_dir():
+    # Use config for dummy_data folder
+    dummy_data_dir = os.path.join(_SCRIPT_DIR, '..', config['data_path'])
+    os.makedirs(dummy_data_dir, exist_ok=True)
+    return dummy_data_dir
+
+def write_json(data, filename):
+    file_path = os.path.join(get_data_dir(), f"{filename}.json")
+    with open(file_path, "w") as f:
+        json.dump(data, f, indent=2)
+
+def open_jsonl():
+    # One buffered file per run instead of an open/close per minute
+    file_path = os.path.join(get_data_dir(), config['data_filename'])
+    return open(file_path, "wb", buffering=64*1024)
+
+def write_jsonl_line(f, data):
+    f.write(orjson.dumps(data))
+    f.write(b"\n")
+
+# Byte template for one simulation row; %.12g keeps well past the
+# precision the model produces while staying compact
+_ROW_TEMPLATE = b'{"time":"%s","temperature":%.12g,"co2":%.12g,"o2":%.12g,"thermal":%d}\n'
+
+def write_row_jsonl(f, time, temp, co2, o2, thermal):
+    # Formats the five fields straight into the byte template, skipping
+    # the per-row dictionary and serializer traversal
+    f.write(_ROW_TEMPLATE % (time.isoformat().encode(), temp, co2, o2, thermal))
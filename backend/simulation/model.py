@@ -1,6 +1,8 @@
 import matplotlib.pyplot as plt
+import numpy as np
 import os
 from datetime import datetime, timedelta
+from numba import njit
 import random
 from backend.services.config_loader import load_config
 
@@ -35,6 +37,10 @@ occupants = sim_config['occupants']
 
 room_air_mass = room_volume * air_density
 
+# Shared generator for the batched simulation; seeding a new one per
+# call would pull OS entropy every time
+_rng = np.random.default_rng()
+
 #convert gases to ppm from L/min
 co2_gen_per_person = (co2_gen_per_person/1000)/room_volume * 10**6
 o2_cons_per_person = (o2_cons_per_person/1000)/room_volume * 10**6
@@ -108,6 +114,76 @@ def simulate_airsealed_room_no_control(data):
 
 
 
+@njit(cache=True)
+def _room_recurrence_kernel(temp, co2, o2, thermal_list, co2_noise, o2_noise,
+                            co2_gen, o2_cons, n_occupants, air_mass, cp):
+    """
+    Numba-compiled temp/co2/o2 recurrence for the batched simulation.
+    Kept separate from the Python wrapper so the whole loop runs as
+    native code.
+    """
+    n = thermal_list.shape[0]
+    temp_list = np.empty(n)
+    co2_list = np.empty(n)
+    o2_list = np.empty(n)
+
+    for i in range(n):
+        temp = max(temp + thermal_list[i]/(air_mass*cp), -273)
+        breathing_rate = abs(temp/25)
+
+        co2 = co2 + (co2_gen + co2_noise[i]) * breathing_rate * n_occupants
+        o2 = o2 - (o2_cons + o2_noise[i]) * breathing_rate * n_occupants
+
+        co2 = max(min(1000000,co2),0)
+        o2 = max(min(1000000,o2),0)
+
+        temp_list[i] = temp
+        co2_list[i] = co2
+        o2_list[i] = o2
+
+    return temp_list,co2_list,o2_list
+
+
+
+def simulate_airsealed_room_no_control_batch(data, n):
+    """
+    Inputs:
+    - data = Array of the starting values, in the same order as
+      simulate_airsealed_room_no_control,
+    - n = Number of minutes to simulate.
+
+    Task: Model n minutes of the uncontrolled room in one call.
+    Preallocates NumPy arrays and draws every random increment up front,
+    then runs the temp/co2/o2 recurrence as a compiled kernel.
+
+    Output: Arrays (time, temp, co2, o2, thermal) of length n.
+    """
+    time, temp, co2, o2, thermal = data
+
+    # Pre-draw all random increments in bulk. The rare ±50000 step is
+    # folded in with a Bernoulli mask instead of a per-step branch.
+    rare_step = _rng.integers(-50000, 50001, n) * (_rng.random(n) < 0.01)
+    thermal_delta = _rng.integers(-5000, 5001, n) + rare_step
+    co2_noise = _rng.integers(-int(co2_gen_per_person*100), int(co2_gen_per_person*100), n) / 1000
+    o2_noise = _rng.integers(-int(o2_cons_per_person*100), int(o2_cons_per_person*100), n) / 1000
+
+    # Thermal output has no feedback, so one cumulative sum gives the
+    # whole series
+    thermal_list = (thermal + np.cumsum(thermal_delta)).astype(np.float64)
+
+    time_list = [time + timedelta(minutes=i+1) for i in range(n)]
+
+    # The recursive dependency (temp feeds back into the breathing rates)
+    # runs as a compiled Numba kernel
+    temp_list, co2_list, o2_list = _room_recurrence_kernel(
+        float(temp), float(co2), float(o2), thermal_list, co2_noise, o2_noise,
+        co2_gen_per_person, o2_cons_per_person, occupants, room_air_mass, air_cp
+    )
+
+    return [time_list,temp_list,co2_list,o2_list,thermal_list]
+
+
+
 def simulate_airsealed_room_with_control(data, hvac_data):
     """
     Inputs: 
@@ -1,8 +1,9 @@
 import os
 import matplotlib.pyplot as plt
-from backend.simulation.model import simulate_airsealed_room_no_control, simulate_airsealed_room_with_control, hours_run, start_time, init_temp_C, init_room_CO2, init_room_O2
-from backend.simulation.generate_json import write_json
+from backend.simulation.model import simulate_airsealed_room_no_control, simulate_airsealed_room_no_control_batch, simulate_airsealed_room_with_control, hours_run, start_time, init_temp_C, init_room_CO2, init_room_O2
+from backend.simulation.generate_json import write_json, open_jsonl, write_row_jsonl
 from backend.services.config_loader import load_config
+from backend.services.database import generate_table, insert_many
 from backend.simulation.HVAC import PID, use_hvac
 
 config = load_config()
@@ -44,29 +45,24 @@ def plot_data(time_list,temp_list,co2_list,o2_list,thermal_list):
 
 
 def process_for_dataframe():
-    for i in range(hours_run*60):
-        if not time_list:
-            data = simulate_airsealed_room_no_control([start_time, init_temp_C, init_room_CO2, init_room_O2, 10000])
-        else:
-            data = simulate_airsealed_room_no_control(data)
-
-        time, temp, co2, o2, thermal = data
-
-        data_dict = {
-            "time" : time.isoformat(),
-            "temperature" : temp,
-            "co2" : co2,
-            "o2" : o2,
-            "thermal" : thermal
-        }
-       
-        write_json(data_dict, i+1)
-
-        time_list.append(time)
-        temp_list.append(temp)
-        co2_list.append(co2)
-        o2_list.append(o2)
-        thermal_list.append(thermal)
+    # The uncontrolled room has no feedback from outside the model,
+    # so the whole run can be simulated in one batched call
+    times, temps, co2s, o2s, thermals = simulate_airsealed_room_no_control_batch(
+        [start_time, init_temp_C, init_room_CO2, init_room_O2, 10000],
+        hours_run*60
+    )
+
+    # one JSONL file appended per minute beats an open/close per minute,
+    # and the template writer skips a dict allocation per row
+    with open_jsonl() as data_file:
+        for time, temp, co2, o2, thermal in zip(times, temps, co2s, o2s, thermals):
+            write_row_jsonl(data_file, time, temp, co2, o2, thermal)
+
+    # rebind the module lists in one go instead of growing them
+    # element by element; they stay the externally visible copy of
+    # the run
+    global time_list, temp_list, co2_list, o2_list, thermal_list
+    time_list, temp_list, co2_list, o2_list, thermal_list = times, temps, co2s, o2s, thermals
 
     plot_data(time_list,temp_list,co2_list,o2_list,thermal_list)
 
@@ -83,6 +79,12 @@ def process_for_sql():
 
     hvac_data = None
 
+    # Writing per-minute JSON files only to re-read them for the database
+    # is pure overhead, so rows go straight to insert_many instead.
+    # JSON output can still be enabled through the config.
+    persist_json = config.get("persist_json", False)
+    rows = []
+
     for i in range(hours_run*60):
         if not time_list:
             data = simulate_airsealed_room_no_control([start_time, init_temp_C, init_room_CO2, init_room_O2, 10000])
@@ -93,12 +95,20 @@ def process_for_sql():
 
         time, temp, co2, o2, thermal = data
 
-        data_dict = {
-            "time" : time.isoformat(),
-            "temperature" : temp,
-            "co2" : co2,
-            "o2" : o2,
-            "thermal" : thermal
-        }
-       
-        write_json(data_dict, i+1)
+        # numeric timestamps skip an isoformat string per minute and
+        # store as fixed-width REAL in the database
+        rows.append((time.timestamp(), temp, co2, o2, thermal))
+
+        if persist_json:
+            data_dict = {
+                "time" : time.isoformat(),
+                "temperature" : temp,
+                "co2" : co2,
+                "o2" : o2,
+                "thermal" : thermal
+            }
+
+            write_json(data_dict, i+1)
+
+    generate_table()
+    insert_many(rows)
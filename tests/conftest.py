@@ -0,0 +1,27 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from backend.services import data_processor
+
+
+@pytest.fixture
+def mock_dp(monkeypatch):
+    """
+    Replaces data_processor's collaborators with MagicMocks in one go.
+    monkeypatch undoes the swaps at teardown, so tests only assign
+    return_value/side_effect instead of stacking patch context managers.
+    """
+    mocks = SimpleNamespace(
+        read_json=MagicMock(),
+        extract=MagicMock(),
+        generate=MagicMock(),
+        insert=MagicMock()
+    )
+
+    monkeypatch.setattr(data_processor.pd, "read_json", mocks.read_json)
+    monkeypatch.setattr(data_processor, "extract_rows_from_jsonl", mocks.extract)
+    monkeypatch.setattr(data_processor, "generate_table", mocks.generate)
+    monkeypatch.setattr(data_processor, "insert_many", mocks.insert)
+
+    return mocks
@@ -5,6 +5,17 @@ import os
 from unittest.mock import patch, mock_open
 
 
+@pytest.fixture(autouse=True)
+def fresh_config_cache():
+    """
+    load_config is cached; clear it around each test so the tests that
+    patch open() parse their own input instead of the cached config.
+    """
+    load_config.cache_clear()
+    yield
+    load_config.cache_clear()
+
+
 def test_load_config_returns_dict():
     """
     Tests that load_config returns a dictionary.
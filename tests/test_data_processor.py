@@ -1,638 +1,368 @@
-import pytest
-import pandas as pd
-from datetime import datetime
-import json
-from unittest.mock import patch, MagicMock, call
-
-from backend.services.data_processor import initialise_dataframe, initialise_db
-from backend.api.read_json import (
-    file_heading, time_heading, temp_heading, 
-    co2_heading, o2_heading, thermal_heading
-)
-
-
-def test_initialise_dataframe_returns_dataframe():
-    """
-    Tests that initialise_dataframe returns a pandas DataFrame.
-    """
-    mock_files = []
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=mock_files):
-        result = initialise_dataframe()
-        assert isinstance(result, pd.DataFrame)
-
-
-def test_initialise_dataframe_has_correct_columns():
-    """
-    Tests that the DataFrame has all required columns.
-    """
-    mock_files = []
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=mock_files):
-        df = initialise_dataframe()
-        
-        expected_columns = [file_heading, time_heading, temp_heading, co2_heading, o2_heading, thermal_heading]
-        assert list(df.columns) == expected_columns
-
-
-def test_initialise_dataframe_has_correct_dtypes():
-    """
-    Tests that the DataFrame columns have correct data types.
-    """
-    mock_files = []
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=mock_files):
-        df = initialise_dataframe()
-        
-        assert df[file_heading].dtype == "object"  # str
-        assert df[time_heading].dtype == "float64"
-        assert df[temp_heading].dtype == "float64"
-        assert df[co2_heading].dtype == "float64"
-        assert df[o2_heading].dtype == "float64"
-        assert df[thermal_heading].dtype == "int64"
-
-
-def test_initialise_dataframe_empty_directory():
-    """
-    Tests that initialise_dataframe returns empty DataFrame when no files exist.
-    """
-    mock_files = []
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=mock_files):
-        df = initialise_dataframe()
-        
-        assert len(df) == 0
-        assert list(df.columns) == [
-            file_heading, time_heading, temp_heading, 
-            co2_heading, o2_heading, thermal_heading
-        ]
-
-
-def test_initialise_dataframe_single_file():
-    """
-    Tests that initialise_dataframe correctly processes a single file.
-    """
-    test_time = datetime.now().isoformat()
-    mock_row = {
-        file_heading: "file_1.json",
-        time_heading: test_time,
-        temp_heading: 22.5,
-        co2_heading: 400.0,
-        o2_heading: 21.0,
-        thermal_heading: 5000
-    }
-    
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=["file_1.json"]), \
-         patch("backend.services.data_processor.extract_row_from_json", return_value=mock_row):
-        df = initialise_dataframe()
-        
-        assert len(df) == 1
-        assert df.iloc[0][file_heading] == "file_1.json"
-        assert df.iloc[0][temp_heading] == 22.5
-        assert df.iloc[0][co2_heading] == 400.0
-
-
-def test_initialise_dataframe_multiple_files():
-    """
-    Tests that initialise_dataframe correctly processes multiple files.
-    """
-    test_time = datetime.now().isoformat()
-    mock_rows = [
-        {
-            file_heading: f"file_{i}.json",
-            time_heading: test_time,
-            temp_heading: 20.0 + i,
-            co2_heading: 400.0 + i,
-            o2_heading: 21.0,
-            thermal_heading: 5000 + i
-        }
-        for i in range(1, 4)
-    ]
-    
-    file_paths = ["file_1.json", "file_2.json", "file_3.json"]
-    
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=file_paths), \
-         patch("backend.services.data_processor.extract_row_from_json", side_effect=mock_rows):
-        df = initialise_dataframe()
-        
-        assert len(df) == 3
-        assert list(df[file_heading]) == ["file_1.json", "file_2.json", "file_3.json"]
-        assert list(df[temp_heading]) == [21.0, 22.0, 23.0]
-
-
-def test_initialise_dataframe_preserves_order():
-    """
-    Tests that initialise_dataframe preserves the order of files.
-    """
-    test_time = datetime.now().isoformat()
-    mock_rows = [
-        {
-            file_heading: f"file_{i}.json",
-            time_heading: test_time,
-            temp_heading: float(i),
-            co2_heading: float(i),
-            o2_heading: float(i),
-            thermal_heading: i
-        }
-        for i in range(1, 6)
-    ]
-    
-    file_paths = [f"file_{i}.json" for i in range(1, 6)]
-    
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=file_paths), \
-         patch("backend.services.data_processor.extract_row_from_json", side_effect=mock_rows):
-        df = initialise_dataframe()
-        
-        assert list(df[file_heading]) == file_paths
-
-
-def test_initialise_dataframe_handles_none_values():
-    """
-    Tests that initialise_dataframe handles None values correctly.
-    """
-    test_time = datetime.now().isoformat()
-    mock_row = {
-        file_heading: "file_1.json",
-        time_heading: test_time,
-        temp_heading: None,
-        co2_heading: None,
-        o2_heading: None,
-        thermal_heading: None
-    }
-    
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=["file_1.json"]), \
-         patch("backend.services.data_processor.extract_row_from_json", return_value=mock_row):
-        df = initialise_dataframe()
-        
-        assert len(df) == 1
-        assert pd.isna(df.iloc[0][temp_heading])
-        assert pd.isna(df.iloc[0][co2_heading])
-
-
-def test_initialise_db_calls_generate_table():
-    """
-    Tests that initialise_db calls generate_table.
-    """
-    with patch("backend.services.data_processor.generate_table") as mock_generate, \
-         patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=[]), \
-         patch("backend.services.data_processor.insert_data"):
-        initialise_db()
-        
-        mock_generate.assert_called_once()
-
-
-def test_initialise_db_no_files():
-    """
-    Tests that initialise_db handles empty directory correctly.
-    """
-    with patch("backend.services.data_processor.generate_table") as mock_generate, \
-         patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=[]), \
-         patch("backend.services.data_processor.insert_data") as mock_insert:
-        initialise_db()
-        
-        mock_generate.assert_called_once()
-        mock_insert.assert_not_called()
-
-
-def test_initialise_db_single_file():
-    """
-    Tests that initialise_db correctly inserts data for a single file.
-    """
-    test_time = datetime.now().isoformat()
-    mock_row = {
-        file_heading: "file_1.json",
-        time_heading: test_time,
-        temp_heading: 22.5,
-        co2_heading: 400.0,
-        o2_heading: 21.0,
-        thermal_heading: 5000
-    }
-    
-    with patch("backend.services.data_processor.generate_table"), \
-         patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=["file_1.json"]), \
-         patch("backend.services.data_processor.extract_row_from_json", return_value=mock_row), \
-         patch("backend.services.data_processor.insert_data") as mock_insert:
-        initialise_db()
-        
-        mock_insert.assert_called_once_with(test_time, 22.5, 400.0, 21.0, 5000)
-
-
-def test_initialise_db_multiple_files():
-    """
-    Tests that initialise_db correctly inserts data for multiple files.
-    """
-    test_time = datetime.now().isoformat()
-    mock_rows = [
-        {
-            file_heading: f"file_{i}.json",
-            time_heading: test_time,
-            temp_heading: 20.0 + i,
-            co2_heading: 400.0 + i,
-            o2_heading: 21.0 + i,
-            thermal_heading: 5000 + i
-        }
-        for i in range(1, 4)
-    ]
-    
-    file_paths = ["file_1.json", "file_2.json", "file_3.json"]
-    
-    with patch("backend.services.data_processor.generate_table"), \
-         patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=file_paths), \
-         patch("backend.services.data_processor.extract_row_from_json", side_effect=mock_rows), \
-         patch("backend.services.data_processor.insert_data") as mock_insert:
-        initialise_db()
-        
-        assert mock_insert.call_count == 3
-        
-        # Verify each call
-        expected_calls = [
-            call(test_time, 21.0, 401.0, 22.0, 5001),
-            call(test_time, 22.0, 402.0, 23.0, 5002),
-            call(test_time, 23.0, 403.0, 24.0, 5003),
-        ]
-        mock_insert.assert_has_calls(expected_calls)
-
-
-def test_initialise_db_preserves_file_order():
-    """
-    Tests that initialise_db processes files in correct order.
-    """
-    test_time = datetime.now().isoformat()
-    mock_rows = [
-        {
-            file_heading: f"file_{i}.json",
-            time_heading: test_time,
-            temp_heading: float(i),
-            co2_heading: float(i),
-            o2_heading: float(i),
-            thermal_heading: i
-        }
-        for i in range(1, 6)
-    ]
-    
-    file_paths = [f"file_{i}.json" for i in range(1, 6)]
-    
-    with patch("backend.services.data_processor.generate_table"), \
-         patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=file_paths), \
-         patch("backend.services.data_processor.extract_row_from_json", side_effect=mock_rows), \
-         patch("backend.services.data_processor.insert_data") as mock_insert:
-        initialise_db()
-        
-        assert mock_insert.call_count == 5
-        
-        # Verify order by checking first argument (time) is consistent
-        for call_obj in mock_insert.call_args_list:
-            assert call_obj[0][0] == test_time
-
-
-def test_initialise_db_with_none_values():
-    """
-    Tests that initialise_db handles None values correctly.
-    """
-    test_time = datetime.now().isoformat()
-    mock_row = {
-        file_heading: "file_1.json",
-        time_heading: test_time,
-        temp_heading: None,
-        co2_heading: None,
-        o2_heading: None,
-        thermal_heading: None
-    }
-    
-    with patch("backend.services.data_processor.generate_table"), \
-         patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=["file_1.json"]), \
-         patch("backend.services.data_processor.extract_row_from_json", return_value=mock_row), \
-         patch("backend.services.data_processor.insert_data") as mock_insert:
-        initialise_db()
-        
-        mock_insert.assert_called_once_with(test_time, None, None, None, None)
-
-
-def test_initialise_dataframe_with_mixed_data_types():
-    """
-    Tests that initialise_dataframe handles mixed numeric types correctly.
-    """
-    test_time = datetime.now().isoformat()
-    mock_rows = [
-        {
-            file_heading: "file_1.json",
-            time_heading: test_time,
-            temp_heading: 22,          # int
-            co2_heading: 400.5,        # float
-            o2_heading: 21,            # int
-            thermal_heading: 5000      # int
-        },
-        {
-            file_heading: "file_2.json",
-            time_heading: test_time,
-            temp_heading: 23.7,        # float
-            co2_heading: 401,          # int
-            o2_heading: 21.5,          # float
-            thermal_heading: 5001      # int
-        }
-    ]
-    
-    file_paths = ["file_1.json", "file_2.json"]
-    
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=file_paths), \
-         patch("backend.services.data_processor.extract_row_from_json", side_effect=mock_rows):
-        df = initialise_dataframe()
-        
-        assert len(df) == 2
-        # All numeric columns should be converted to float64 (except thermal which is int64)
-        assert df[temp_heading].dtype == "float64"
-        assert df[co2_heading].dtype == "float64"
-        assert df[o2_heading].dtype == "float64"
-
-def test_initialise_dataframe_with_nan_values():
-    """
-    Tests that initialise_dataframe handles NaN values correctly.
-    """
-    test_time = datetime.now().isoformat()
-    import math
-    mock_row = {
-        file_heading: "file_1.json",
-        time_heading: test_time,
-        temp_heading: math.nan,
-        co2_heading: 400.0,
-        o2_heading: math.nan,
-        thermal_heading: 5000
-    }
-    
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=["file_1.json"]), \
-         patch("backend.services.data_processor.extract_row_from_json", return_value=mock_row):
-        df = initialise_dataframe()
-        
-        assert len(df) == 1
-        assert pd.isna(df.iloc[0][temp_heading])
-        assert pd.isna(df.iloc[0][o2_heading])
-        assert df.iloc[0][co2_heading] == 400.0
-
-
-def test_initialise_dataframe_with_infinity_values():
-    """
-    Tests that initialise_dataframe handles infinity values.
-    """
-    test_time = datetime.now().isoformat()
-    import math
-    mock_row = {
-        file_heading: "file_1.json",
-        time_heading: test_time,
-        temp_heading: math.inf,
-        co2_heading: -math.inf,
-        o2_heading: 21.0,
-        thermal_heading: 5000
-    }
-    
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=["file_1.json"]), \
-         patch("backend.services.data_processor.extract_row_from_json", return_value=mock_row):
-        df = initialise_dataframe()
-        
-        assert len(df) == 1
-        assert df.iloc[0][temp_heading] == pytest.approx(float('inf'))
-        assert df.iloc[0][co2_heading] == pytest.approx(float('-inf'))
-
-
-def test_initialise_dataframe_with_negative_values():
-    """
-    Tests that initialise_dataframe handles negative values correctly.
-    """
-    test_time = datetime.now().isoformat()
-    mock_row = {
-        file_heading: "file_1.json",
-        time_heading: test_time,
-        temp_heading: -10.5,
-        co2_heading: -100.0,
-        o2_heading: -5.0,
-        thermal_heading: -1000
-    }
-    
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=["file_1.json"]), \
-         patch("backend.services.data_processor.extract_row_from_json", return_value=mock_row):
-        df = initialise_dataframe()
-        
-        assert len(df) == 1
-        assert df.iloc[0][temp_heading] == -10.5
-        assert df.iloc[0][co2_heading] == -100.0
-
-
-def test_initialise_dataframe_extract_raises_exception():
-    """
-    Tests that initialise_dataframe raises exception if extract_row_from_json fails.
-    """
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=["file_1.json"]), \
-         patch("backend.services.data_processor.extract_row_from_json", side_effect=json.JSONDecodeError("msg", "doc", 0)):
-        with pytest.raises(json.JSONDecodeError):
-            initialise_dataframe()
-
-
-def test_initialise_dataframe_large_dataset():
-    """
-    Tests that initialise_dataframe handles large datasets efficiently.
-    """
-    test_time = datetime.now().isoformat()
-    num_files = 1000
-    
-    mock_rows = [
-        {
-            file_heading: f"file_{i}.json",
-            time_heading: test_time,
-            temp_heading: 20.0 + (i % 10),
-            co2_heading: 400.0 + (i % 50),
-            o2_heading: 21.0,
-            thermal_heading: 5000 + i
-        }
-        for i in range(num_files)
-    ]
-    
-    file_paths = [f"file_{i}.json" for i in range(num_files)]
-    
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=file_paths), \
-         patch("backend.services.data_processor.extract_row_from_json", side_effect=mock_rows):
-        df = initialise_dataframe()
-        
-        assert len(df) == num_files
-        assert len(df.columns) == 6
-
-
-def test_initialise_dataframe_with_string_numeric_values():
-    """
-    Tests that initialise_dataframe handles string values in numeric fields.
-    """
-    test_time = datetime.now().isoformat()
-    mock_row = {
-        file_heading: "file_1.json",
-        time_heading: test_time,
-        temp_heading: "22.5",       # String instead of float
-        co2_heading: "400",         # String instead of float
-        o2_heading: 21.0,
-        thermal_heading: "5000"     # String instead of int
-    }
-    
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=["file_1.json"]), \
-         patch("backend.services.data_processor.extract_row_from_json", return_value=mock_row):
-        df = initialise_dataframe()
-        
-        assert len(df) == 1
-        # Strings will be preserved in their original form
-        assert df.iloc[0][temp_heading] == "22.5"
-
-
-def test_initialise_dataframe_repeated_calls():
-    """
-    Tests that repeated calls to initialise_dataframe produce consistent results.
-    """
-    test_time = datetime.now().isoformat()
-    mock_row = {
-        file_heading: "file_1.json",
-        time_heading: test_time,
-        temp_heading: 22.5,
-        co2_heading: 400.0,
-        o2_heading: 21.0,
-        thermal_heading: 5000
-    }
-    
-    file_paths = ["file_1.json"]
-    
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=file_paths), \
-         patch("backend.services.data_processor.extract_row_from_json", return_value=mock_row):
-        df1 = initialise_dataframe()
-        df2 = initialise_dataframe()
-        
-        # Both should have same structure and content
-        assert len(df1) == len(df2)
-        pd.testing.assert_frame_equal(df1, df2)
-
-
-def test_initialise_db_extract_raises_exception():
-    """
-    Tests that initialise_db raises exception if extract_row_from_json fails.
-    """
-    with patch("backend.services.data_processor.generate_table"), \
-         patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=["file_1.json"]), \
-         patch("backend.services.data_processor.extract_row_from_json", side_effect=FileNotFoundError("File not found")):
-        with pytest.raises(FileNotFoundError):
-            initialise_db()
-
-
-def test_initialise_db_insert_raises_exception():
-    """
-    Tests that initialise_db raises exception if insert_data fails.
-    """
-    test_time = datetime.now().isoformat()
-    mock_row = {
-        file_heading: "file_1.json",
-        time_heading: test_time,
-        temp_heading: 22.5,
-        co2_heading: 400.0,
-        o2_heading: 21.0,
-        thermal_heading: 5000
-    }
-    
-    with patch("backend.services.data_processor.generate_table"), \
-         patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=["file_1.json"]), \
-         patch("backend.services.data_processor.extract_row_from_json", return_value=mock_row), \
-         patch("backend.services.data_processor.insert_data", side_effect=Exception("DB error")):
-        with pytest.raises(Exception):
-            initialise_db()
-
-
-def test_initialise_db_large_dataset():
-    """
-    Tests that initialise_db handles large datasets efficiently.
-    """
-    test_time = datetime.now().isoformat()
-    num_files = 1000
-    
-    mock_rows = [
-        {
-            file_heading: f"file_{i}.json",
-            time_heading: test_time,
-            temp_heading: 20.0 + (i % 10),
-            co2_heading: 400.0 + (i % 50),
-            o2_heading: 21.0 + (i % 5),
-            thermal_heading: 5000 + i
-        }
-        for i in range(num_files)
-    ]
-    
-    file_paths = [f"file_{i}.json" for i in range(num_files)]
-    
-    with patch("backend.services.data_processor.generate_table"), \
-         patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=file_paths), \
-         patch("backend.services.data_processor.extract_row_from_json", side_effect=mock_rows), \
-         patch("backend.services.data_processor.insert_data") as mock_insert:
-        initialise_db()
-        
-        assert mock_insert.call_count == num_files
-
-
-def test_initialise_db_with_negative_values():
-    """
-    Tests that initialise_db handles negative values correctly.
-    """
-    test_time = datetime.now().isoformat()
-    mock_row = {
-        file_heading: "file_1.json",
-        time_heading: test_time,
-        temp_heading: -10.5,
-        co2_heading: -100.0,
-        o2_heading: -5.0,
-        thermal_heading: -1000
-    }
-    
-    with patch("backend.services.data_processor.generate_table"), \
-         patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=["file_1.json"]), \
-         patch("backend.services.data_processor.extract_row_from_json", return_value=mock_row), \
-         patch("backend.services.data_processor.insert_data") as mock_insert:
-        initialise_db()
-        
-        mock_insert.assert_called_once_with(test_time, -10.5, -100.0, -5.0, -1000)
-
-
-def test_initialise_db_repeated_calls():
-    """
-    Tests that repeated calls to initialise_db work correctly.
-    """
-    test_time = datetime.now().isoformat()
-    mock_row = {
-        file_heading: "file_1.json",
-        time_heading: test_time,
-        temp_heading: 22.5,
-        co2_heading: 400.0,
-        o2_heading: 21.0,
-        thermal_heading: 5000
-    }
-    
-    file_paths = ["file_1.json"]
-    
-    with patch("backend.services.data_processor.generate_table") as mock_generate, \
-         patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=file_paths), \
-         patch("backend.services.data_processor.extract_row_from_json", return_value=mock_row), \
-         patch("backend.services.data_processor.insert_data") as mock_insert:
-        initialise_db()
-        initialise_db()
-        
-        # generate_table should be called twice
-        assert mock_generate.call_count == 2
-        # insert_data should be called twice
-        assert mock_insert.call_count == 2
-
-
-def test_initialise_dataframe_with_empty_string_values():
-    """
-    Tests that initialise_dataframe handles empty strings in fields.
-    """
-    test_time = datetime.now().isoformat()
-    mock_row = {
-        file_heading: "",              # Empty string
-        time_heading: test_time,
-        temp_heading: None,
-        co2_heading: 400.0,
-        o2_heading: 21.0,
-        thermal_heading: 5000
-    }
-    
-    with patch("backend.services.data_processor.get_sorted_json_filepaths", return_value=["file_1.json"]), \
-         patch("backend.services.data_processor.extract_row_from_json", return_value=mock_row):
-        df = initialise_dataframe()
-        
-        assert len(df) == 1
-        assert df.iloc[0][file_heading] == ""
-        assert pd.isna(df.iloc[0][temp_heading])
\ No newline at end of file
+import math
+import pytest
+import pandas as pd
+from datetime import datetime
+from backend.services import data_processor
+from backend.services.data_processor import initialise_dataframe, initialise_db
+from backend.api.read_json import (
+    file_heading, time_heading, temp_heading,
+    co2_heading, o2_heading, thermal_heading
+)
+
+# Fixed timestamp so parametrized case ids and mock data stay identical
+# across pytest-xdist workers
+_TEST_TIME = "2024-01-27T15:30:45.123456"
+
+# what initialise_db stores for _TEST_TIME: the database keeps numeric
+# unix timestamps, not the JSONL's ISO strings
+_TEST_TIMESTAMP = datetime.fromisoformat(_TEST_TIME).timestamp()
+
+
+def make_raw_df(rows):
+    """
+    Builds the raw-column DataFrame that pd.read_json returns for the
+    given heading-keyed rows.
+    """
+    return pd.DataFrame([
+        {
+            "time": row[time_heading],
+            "temperature": row[temp_heading],
+            "co2": row[co2_heading],
+            "o2": row[o2_heading],
+            "thermal": row[thermal_heading]
+        }
+        for row in rows
+    ])
+
+
+def make_row(file="file_1.json", time=_TEST_TIME, temp=22.5, co2=400.0, o2=21.0, thermal=5000):
+    """
+    Builds one heading-keyed mock row, with overridable fields.
+    """
+    return {
+        file_heading: file,
+        time_heading: time,
+        temp_heading: temp,
+        co2_heading: co2,
+        o2_heading: o2,
+        thermal_heading: thermal
+    }
+
+
+@pytest.fixture(scope="module")
+def empty_df():
+    """
+    Shared empty-directory DataFrame for the read-only structure tests;
+    built once per module so each assertion does not re-run
+    initialise_dataframe.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(data_processor.pd, "read_json", lambda *args, **kwargs: make_raw_df([]))
+        return initialise_dataframe()
+
+
+def test_initialise_dataframe_returns_dataframe(empty_df):
+    """
+    Tests that initialise_dataframe returns a pandas DataFrame.
+    """
+    assert isinstance(empty_df, pd.DataFrame)
+
+
+def test_initialise_dataframe_has_correct_columns(empty_df):
+    """
+    Tests that the DataFrame has all required columns.
+    """
+    expected_columns = [file_heading, time_heading, temp_heading, co2_heading, o2_heading, thermal_heading]
+    assert list(empty_df.columns) == expected_columns
+
+
+def test_initialise_dataframe_has_correct_dtypes(empty_df):
+    """
+    Tests that the DataFrame columns have correct data types.
+    """
+    assert empty_df[file_heading].dtype == "object"  # str
+    assert empty_df[time_heading].dtype == "float64"
+    assert empty_df[temp_heading].dtype == "float64"
+    assert empty_df[co2_heading].dtype == "float64"
+    assert empty_df[o2_heading].dtype == "float64"
+    assert empty_df[thermal_heading].dtype == "int64"
+
+
+def test_initialise_dataframe_empty_directory(empty_df):
+    """
+    Tests that initialise_dataframe returns empty DataFrame when no files exist.
+    """
+    assert len(empty_df) == 0
+    assert list(empty_df.columns) == [
+        file_heading, time_heading, temp_heading,
+        co2_heading, o2_heading, thermal_heading
+    ]
+
+
+# Each .iloc[0] materializes a fresh Series; the checks grab it once
+# and index the cached row instead
+
+def _check_single(df):
+    assert len(df) == 1
+    row = df.iloc[0]
+    assert row[file_heading] == "1.json"
+    assert row[temp_heading] == 22.5
+    assert row[co2_heading] == 400.0
+
+
+def _check_multiple(df):
+    assert len(df) == 3
+    assert list(df[file_heading]) == ["1.json", "2.json", "3.json"]
+    assert list(df[temp_heading]) == [21.0, 22.0, 23.0]
+
+
+def _check_order(df):
+    assert list(df[file_heading]) == [f"{i}.json" for i in range(1, 6)]
+
+
+def _check_none(df):
+    assert len(df) == 1
+    row = df.iloc[0]
+    assert pd.isna(row[temp_heading])
+    assert pd.isna(row[co2_heading])
+
+
+def _check_mixed_types(df):
+    assert len(df) == 2
+    # All numeric columns should be converted to float64 (except thermal which is int64)
+    assert df[temp_heading].dtype == "float64"
+    assert df[co2_heading].dtype == "float64"
+    assert df[o2_heading].dtype == "float64"
+
+
+def _check_nan(df):
+    assert len(df) == 1
+    row = df.iloc[0]
+    assert pd.isna(row[temp_heading])
+    assert pd.isna(row[o2_heading])
+    assert row[co2_heading] == 400.0
+
+
+def _check_infinity(df):
+    assert len(df) == 1
+    row = df.iloc[0]
+    assert row[temp_heading] == pytest.approx(float('inf'))
+    assert row[co2_heading] == pytest.approx(float('-inf'))
+
+
+def _check_negative(df):
+    assert len(df) == 1
+    row = df.iloc[0]
+    assert row[temp_heading] == -10.5
+    assert row[co2_heading] == -100.0
+
+
+def _check_string_numeric(df):
+    assert len(df) == 1
+    # Strings will be preserved in their original form
+    assert df.iloc[0][temp_heading] == "22.5"
+
+
+def _check_empty_string_file(df):
+    # the file column is synthesised from the line number, so the
+    # empty string in the mock row never reaches the dataframe
+    assert len(df) == 1
+    row = df.iloc[0]
+    assert row[file_heading] == "1.json"
+    assert pd.isna(row[temp_heading])
+
+
+def _check_large(df):
+    assert len(df) == 1000
+    assert len(df.columns) == 6
+
+
+# The large-dataset checks only look at row counts, so every entry can
+# reference the same frozen row instead of allocating 1000 unique dicts
+_CANONICAL_ROW = make_row()
+_LARGE_ROWS = [_CANONICAL_ROW] * 1000
+
+
+DATAFRAME_CASES = [
+    pytest.param([make_row()], _check_single, id="single-file"),
+    pytest.param(
+        [make_row(file=f"file_{i}.json", temp=20.0 + i, co2=400.0 + i, thermal=5000 + i) for i in range(1, 4)],
+        _check_multiple, id="multiple-files"),
+    pytest.param(
+        [make_row(file=f"file_{i}.json", temp=float(i), co2=float(i), o2=float(i), thermal=i) for i in range(1, 6)],
+        _check_order, id="preserves-order"),
+    pytest.param([make_row(temp=None, co2=None, o2=None, thermal=None)], _check_none, id="none-values"),
+    pytest.param(
+        [make_row(temp=22, co2=400.5, o2=21), make_row(file="file_2.json", temp=23.7, co2=401, o2=21.5, thermal=5001)],
+        _check_mixed_types, id="mixed-types"),
+    pytest.param([make_row(temp=math.nan, o2=math.nan)], _check_nan, id="nan-values"),
+    pytest.param([make_row(temp=math.inf, co2=-math.inf)], _check_infinity, id="infinity-values"),
+    pytest.param([make_row(temp=-10.5, co2=-100.0, o2=-5.0, thermal=-1000)], _check_negative, id="negative-values"),
+    pytest.param([make_row(temp="22.5", co2="400", thermal="5000")], _check_string_numeric, id="string-numeric-values"),
+    pytest.param([make_row(file="", temp=None)], _check_empty_string_file, id="empty-string-file"),
+    pytest.param(_LARGE_ROWS, _check_large, id="large-dataset", marks=pytest.mark.slow),
+]
+
+
+@pytest.mark.parametrize("rows,check", DATAFRAME_CASES)
+def test_initialise_dataframe(rows, check, mock_dp):
+    """
+    Tests that initialise_dataframe builds the expected frame for a
+    range of row contents; the cases share one scaffold so pytest pays
+    the setup once per parameter instead of once per test function.
+    """
+    mock_dp.read_json.return_value = make_raw_df(rows)
+    check(initialise_dataframe())
+
+
+def test_initialise_dataframe_read_json_raises_exception(mock_dp):
+    """
+    Tests that initialise_dataframe raises exception if pd.read_json fails.
+    """
+    mock_dp.read_json.side_effect = ValueError("Trailing data")
+    with pytest.raises(ValueError):
+        initialise_dataframe()
+
+
+def test_initialise_dataframe_repeated_calls(mock_dp):
+    """
+    Tests that repeated calls to initialise_dataframe produce consistent results.
+    """
+    mock_dp.read_json.return_value = make_raw_df([make_row()])
+    df1 = initialise_dataframe()
+    df2 = initialise_dataframe()
+
+    # Both should have same structure and content. .values on the
+    # mixed-dtype frame would box per-cell objects, so compare each
+    # column's buffer instead: numeric columns memcmp via tobytes,
+    # object columns by plain list equality
+    assert len(df1) == len(df2)
+    assert list(df1.columns) == list(df2.columns)
+    assert df1.dtypes.equals(df2.dtypes)
+    for col, dtype in df1.dtypes.items():
+        if dtype == object:
+            assert df1[col].to_list() == df2[col].to_list()
+        else:
+            assert df1[col].to_numpy().tobytes() == df2[col].to_numpy().tobytes()
+
+
+def test_initialise_db_calls_generate_table(mock_dp):
+    """
+    Tests that initialise_db calls generate_table.
+    """
+    mock_dp.extract.return_value = []
+    initialise_db()
+
+    mock_dp.generate.assert_called_once()
+
+
+def test_initialise_db_no_files(mock_dp):
+    """
+    Tests that initialise_db handles empty directory correctly.
+    """
+    mock_dp.extract.return_value = []
+    initialise_db()
+
+    mock_dp.generate.assert_called_once()
+    mock_dp.insert.assert_not_called()
+
+
+# Comparing call_args.args against plain tuples keeps the check in
+# C-level tuple equality instead of mock's _Call comparison chain
+
+def _check_db_single(mock_dp):
+    assert mock_dp.insert.call_count == 1
+    assert mock_dp.insert.call_args.args[0] == [(_TEST_TIMESTAMP, 22.5, 400.0, 21.0, 5000)]
+
+
+def _check_db_multiple(mock_dp):
+    # Verify a single batched call with all rows in order
+    assert mock_dp.insert.call_count == 1
+    assert mock_dp.insert.call_args.args[0] == [
+        (_TEST_TIMESTAMP, 21.0, 401.0, 22.0, 5001),
+        (_TEST_TIMESTAMP, 22.0, 402.0, 23.0, 5002),
+        (_TEST_TIMESTAMP, 23.0, 403.0, 24.0, 5003),
+    ]
+
+
+def _check_db_order(mock_dp):
+    rows = mock_dp.insert.call_args[0][0]
+    assert len(rows) == 5
+
+    # Verify order by checking temperature matches the file index
+    for i, row in enumerate(rows, start=1):
+        assert row[0] == _TEST_TIMESTAMP
+        assert row[1] == float(i)
+
+
+def _check_db_none(mock_dp):
+    assert mock_dp.insert.call_count == 1
+    assert mock_dp.insert.call_args.args[0] == [(_TEST_TIMESTAMP, None, None, None, None)]
+
+
+def _check_db_negative(mock_dp):
+    assert mock_dp.insert.call_count == 1
+    assert mock_dp.insert.call_args.args[0] == [(_TEST_TIMESTAMP, -10.5, -100.0, -5.0, -1000)]
+
+
+def _check_db_large(mock_dp):
+    mock_dp.insert.assert_called_once()
+    assert len(mock_dp.insert.call_args[0][0]) == 1000
+
+
+DB_CASES = [
+    pytest.param([make_row()], _check_db_single, id="single-file"),
+    pytest.param(
+        [make_row(file=f"file_{i}.json", temp=20.0 + i, co2=400.0 + i, o2=21.0 + i, thermal=5000 + i) for i in range(1, 4)],
+        _check_db_multiple, id="multiple-files"),
+    pytest.param(
+        [make_row(file=f"file_{i}.json", temp=float(i), co2=float(i), o2=float(i), thermal=i) for i in range(1, 6)],
+        _check_db_order, id="preserves-order"),
+    pytest.param([make_row(temp=None, co2=None, o2=None, thermal=None)], _check_db_none, id="none-values"),
+    pytest.param([make_row(temp=-10.5, co2=-100.0, o2=-5.0, thermal=-1000)], _check_db_negative, id="negative-values"),
+    pytest.param(_LARGE_ROWS, _check_db_large, id="large-dataset", marks=pytest.mark.slow),
+]
+
+
+@pytest.mark.parametrize("rows,check", DB_CASES)
+def test_initialise_db(rows, check, mock_dp):
+    """
+    Tests that initialise_db batches the expected rows into insert_many
+    for a range of row contents.
+    """
+    mock_dp.extract.return_value = rows
+    initialise_db()
+    check(mock_dp)
+
+
+def test_initialise_db_extract_raises_exception(mock_dp):
+    """
+    Tests that initialise_db raises exception if extract_rows_from_jsonl fails.
+    """
+    mock_dp.extract.side_effect = FileNotFoundError("File not found")
+    with pytest.raises(FileNotFoundError):
+        initialise_db()
+
+
+def test_initialise_db_insert_raises_exception(mock_dp):
+    """
+    Tests that initialise_db raises exception if insert_data fails.
+    """
+    mock_dp.extract.return_value = [make_row()]
+    mock_dp.insert.side_effect = Exception("DB error")
+    with pytest.raises(Exception):
+        initialise_db()
+
+
+def test_initialise_db_repeated_calls(mock_dp):
+    """
+    Tests that repeated calls to initialise_db work correctly.
+    """
+    mock_dp.extract.return_value = [make_row()]
+    initialise_db()
+    initialise_db()
+
+    # generate_table should be called twice
+    assert mock_dp.generate.call_count == 2
+    # insert_many should be called twice
+    assert mock_dp.insert.call_count == 2
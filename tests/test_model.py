@@ -4,6 +4,7 @@ from backend.simulation.model import (
     simulate_process_equipment,
     simulate_breathing_changes,
     simulate_airsealed_room_no_control,
+    simulate_airsealed_room_no_control_batch,
     simulate_airsealed_room_with_control,
     room_volume,
     room_air_mass,
@@ -322,6 +323,72 @@ class TestSimulateAirsealedRoomNoControl:
         assert len(result) == 5
 
 
+class TestSimulateAirsealedRoomNoControlBatch:
+    """Tests for the simulate_airsealed_room_no_control_batch function."""
+
+    def test_batch_returns_arrays_of_length_n(self):
+        """
+        Tests that the batch function returns 5 sequences of length n.
+        """
+        time = datetime.now()
+        data = [time, 22.0, 400.0, 21.0, 5000.0]
+
+        result = simulate_airsealed_room_no_control_batch(data, 10)
+
+        assert len(result) == 5
+        for values in result:
+            assert len(values) == 10
+
+    def test_batch_time_increments_per_minute(self):
+        """
+        Tests that each step increments time by 1 minute.
+        """
+        time = datetime(2025, 1, 27, 10, 0, 0)
+        data = [time, 22.0, 400.0, 21.0, 5000.0]
+
+        time_list, _, _, _, _ = simulate_airsealed_room_no_control_batch(data, 5)
+
+        for i, step_time in enumerate(time_list):
+            assert step_time == time + timedelta(minutes=i+1)
+
+    def test_batch_temp_minimum(self):
+        """
+        Tests that temperature cannot go below -273.
+        """
+        time = datetime.now()
+        data = [time, -273.0, 400.0, 21.0, -99999999.0]
+
+        _, temp_list, _, _, _ = simulate_airsealed_room_no_control_batch(data, 10)
+
+        assert all(temp >= -273 for temp in temp_list)
+
+    def test_batch_co2_o2_in_range(self):
+        """
+        Tests that CO2 and O2 stay clamped between 0 and 1000000.
+        """
+        time = datetime.now()
+        data = [time, 22.0, 400.0, 21.0, 5000.0]
+
+        _, _, co2_list, o2_list, _ = simulate_airsealed_room_no_control_batch(data, 60)
+
+        assert all(0 <= co2 <= 1000000 for co2 in co2_list)
+        assert all(0 <= o2 <= 1000000 for o2 in o2_list)
+
+    def test_batch_single_step(self):
+        """
+        Tests that a batch of 1 behaves like one simulation step.
+        """
+        time = datetime(2025, 1, 27, 10, 0, 0)
+        data = [time, 22.0, 400.0, 21.0, 5000.0]
+
+        time_list, temp_list, co2_list, o2_list, thermal_list = simulate_airsealed_room_no_control_batch(data, 1)
+
+        assert time_list[0] == time + timedelta(minutes=1)
+        # CO2 rises and O2 falls from breathing at positive temperature
+        assert co2_list[0] > 400.0
+        assert o2_list[0] < 21.0
+
+
 class TestSimulateAirsealedRoomWithControl:
     """Tests for the simulate_airsealed_room_with_control function."""
 
@@ -1,392 +1,403 @@
-import matplotlib
-matplotlib.use('Agg')  # Use non-GUI backend
-
-from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
-
-from backend.simulation.process_model import plot_data, process_for_dataframe, process_for_sql
-
-
-class TestPlotData:
-    """Tests for the plot_data function."""
-
-    def test_plot_data_creates_figure(self):
-        """
-        Tests that plot_data creates a matplotlib figure.
-        """
-        time_list = [datetime.now() + timedelta(minutes=i) for i in range(5)]
-        temp_list = [20.0 + i for i in range(5)]
-        co2_list = [400.0 + i*5 for i in range(5)]
-        o2_list = [21.0 + i*0.1 for i in range(5)]
-        thermal_list = [5000.0 + i*100 for i in range(5)]
-        
-        with patch("backend.simulation.process_model.process_for_dataframe"), \
-             patch("matplotlib.pyplot.show"):
-            plot_data(time_list, temp_list, co2_list, o2_list, thermal_list)
-        
-        # If we get here without error, function worked
-        assert True
-
-    def test_plot_data_with_empty_lists(self):
-        """
-        Tests plot_data with empty data lists.
-        """
-        with patch("backend.simulation.process_model.process_for_dataframe"), \
-             patch("matplotlib.pyplot.show"):
-            plot_data([], [], [], [], [])
-        
-        assert True
-
-    def test_plot_data_with_single_point(self):
-        """
-        Tests plot_data with single data point.
-        """
-        time_list = [datetime.now()]
-        temp_list = [22.0]
-        co2_list = [400.0]
-        o2_list = [21.0]
-        thermal_list = [5000.0]
-        
-        with patch("backend.simulation.process_model.process_for_dataframe"), \
-             patch("matplotlib.pyplot.show"):
-            plot_data(time_list, temp_list, co2_list, o2_list, thermal_list)
-        
-        assert True
-
-    def test_plot_data_with_many_points(self):
-        """
-        Tests plot_data with many data points.
-        """
-        n = 1000
-        time_list = [datetime.now() + timedelta(minutes=i) for i in range(n)]
-        temp_list = [20.0 + (i % 5) for i in range(n)]
-        co2_list = [400.0 + (i % 100) for i in range(n)]
-        o2_list = [21.0 + (i % 2) * 0.1 for i in range(n)]
-        thermal_list = [5000.0 + (i % 500) for i in range(n)]
-        
-        with patch("backend.simulation.process_model.process_for_dataframe"), \
-             patch("matplotlib.pyplot.show"):
-            plot_data(time_list, temp_list, co2_list, o2_list, thermal_list)
-        
-        assert True
-
-    def test_plot_data_calls_process_for_dataframe(self):
-        """
-        Tests that plot_data calls process_for_dataframe.
-        """
-        time_list = [datetime.now()]
-        temp_list = [22.0]
-        co2_list = [400.0]
-        o2_list = [21.0]
-        thermal_list = [5000.0]
-        
-        with patch("backend.simulation.process_model.process_for_dataframe") as mock_process, \
-             patch("matplotlib.pyplot.show"):
-            plot_data(time_list, temp_list, co2_list, o2_list, thermal_list)
-            
-            mock_process.assert_called_once()
-
-    def test_plot_data_calls_show(self):
-        """
-        Tests that plot_data calls pyplot.show().
-        """
-        time_list = [datetime.now()]
-        temp_list = [22.0]
-        co2_list = [400.0]
-        o2_list = [21.0]
-        thermal_list = [5000.0]
-        
-        with patch("backend.simulation.process_model.process_for_dataframe"), \
-             patch("matplotlib.pyplot.show") as mock_show:
-            plot_data(time_list, temp_list, co2_list, o2_list, thermal_list)
-            
-            mock_show.assert_called_once()
-
-    def test_plot_data_with_negative_values(self):
-        """
-        Tests plot_data with negative values in data.
-        """
-        time_list = [datetime.now() + timedelta(minutes=i) for i in range(3)]
-        temp_list = [-10.0, 0.0, 10.0]
-        co2_list = [-100.0, 400.0, 500.0]
-        o2_list = [-5.0, 21.0, 30.0]
-        thermal_list = [-1000.0, 5000.0, 10000.0]
-        
-        with patch("backend.simulation.process_model.process_for_dataframe"), \
-             patch("matplotlib.pyplot.show"):
-            plot_data(time_list, temp_list, co2_list, o2_list, thermal_list)
-        
-        assert True
-
-    def test_plot_data_with_large_values(self):
-        """
-        Tests plot_data with large numeric values.
-        """
-        time_list = [datetime.now()]
-        temp_list = [1000.0]
-        co2_list = [1000000.0]
-        o2_list = [1000000.0]
-        thermal_list = [999999.0]
-        
-        with patch("backend.simulation.process_model.process_for_dataframe"), \
-             patch("matplotlib.pyplot.show"):
-            plot_data(time_list, temp_list, co2_list, o2_list, thermal_list)
-        
-        assert True
-
-    def test_plot_data_mismatched_lengths(self):
-        """
-        Tests plot_data with mismatched list lengths.
-        This may cause matplotlib errors which is expected behavior.
-        """
-        time_list = [datetime.now()]
-        temp_list = [20.0, 21.0]  # Different length
-        co2_list = [400.0]
-        o2_list = [21.0]
-        thermal_list = [5000.0]
-        
-        # May raise or handle gracefully depending on matplotlib
-        with patch("backend.simulation.process_model.process_for_dataframe"), \
-             patch("matplotlib.pyplot.show"):
-            try:
-                plot_data(time_list, temp_list, co2_list, o2_list, thermal_list)
-            except (ValueError, IndexError):
-                pass  # Expected for mismatched lengths
-
-
-class TestProcessForDataframe:
-    """Tests for the process_for_dataframe function."""
-
-    def test_process_for_dataframe_generates_data(self):
-        """
-        Tests that process_for_dataframe generates simulation data.
-        """
-        with patch("backend.simulation.process_model.hours_run", 1), \
-             patch("backend.simulation.process_model.start_time", datetime.now()), \
-             patch("backend.simulation.process_model.init_temp_C", 22.0), \
-             patch("backend.simulation.process_model.init_room_CO2", 400.0), \
-             patch("backend.simulation.process_model.init_room_O2", 21.0), \
-             patch("backend.simulation.process_model.write_json"), \
-             patch("backend.simulation.process_model.plot_data"), \
-             patch("backend.simulation.process_model.time_list", []), \
-             patch("backend.simulation.process_model.temp_list", []), \
-             patch("backend.simulation.process_model.co2_list", []), \
-             patch("backend.simulation.process_model.o2_list", []), \
-             patch("backend.simulation.process_model.thermal_list", []):
-            
-            # Function should not raise
-            try:
-                process_for_dataframe()
-            except:
-                pass  # May have issues with global state
-
-    def test_process_for_dataframe_calls_simulate(self):
-        """
-        Tests that process_for_dataframe calls simulation functions.
-        """
-        with patch("backend.simulation.process_model.hours_run", 1), \
-             patch("backend.simulation.process_model.start_time", datetime.now()), \
-             patch("backend.simulation.process_model.init_temp_C", 22.0), \
-             patch("backend.simulation.process_model.init_room_CO2", 400.0), \
-             patch("backend.simulation.process_model.init_room_O2", 21.0), \
-             patch("backend.simulation.process_model.simulate_airsealed_room_no_control") as mock_sim, \
-             patch("backend.simulation.process_model.write_json"), \
-             patch("backend.simulation.process_model.plot_data"), \
-             patch("backend.simulation.process_model.time_list", []), \
-             patch("backend.simulation.process_model.temp_list", []), \
-             patch("backend.simulation.process_model.co2_list", []), \
-             patch("backend.simulation.process_model.o2_list", []), \
-             patch("backend.simulation.process_model.thermal_list", []):
-            
-            mock_sim.return_value = [datetime.now(), 22.0, 400.0, 21.0, 5000.0]
-            
-            try:
-                process_for_dataframe()
-            except:
-                pass
-
-    def test_process_for_dataframe_calls_write_json(self):
-        """
-        Tests that process_for_dataframe calls write_json for each step.
-        """
-        with patch("backend.simulation.process_model.hours_run", 2), \
-             patch("backend.simulation.process_model.start_time", datetime.now()), \
-             patch("backend.simulation.process_model.init_temp_C", 22.0), \
-             patch("backend.simulation.process_model.init_room_CO2", 400.0), \
-             patch("backend.simulation.process_model.init_room_O2", 21.0), \
-             patch("backend.simulation.process_model.simulate_airsealed_room_no_control") as mock_sim, \
-             patch("backend.simulation.process_model.write_json") as mock_write, \
-             patch("backend.simulation.process_model.plot_data"), \
-             patch("backend.simulation.process_model.time_list", []), \
-             patch("backend.simulation.process_model.temp_list", []), \
-             patch("backend.simulation.process_model.co2_list", []), \
-             patch("backend.simulation.process_model.o2_list", []), \
-             patch("backend.simulation.process_model.thermal_list", []):
-            
-            mock_sim.return_value = [datetime.now(), 22.0, 400.0, 21.0, 5000.0]
-            
-            try:
-                process_for_dataframe()
-                # Should have called write_json for hours_run*60 steps
-            except:
-                pass
-
-
-class TestProcessForSql:
-    """Tests for the process_for_sql function."""
-
-    def test_process_for_sql_creates_pids(self):
-        """
-        Tests that process_for_sql initializes PID controllers.
-        """
-        with patch("backend.simulation.process_model.config") as mock_config, \
-             patch("backend.simulation.process_model.hours_run", 1), \
-             patch("backend.simulation.process_model.start_time", datetime.now()), \
-             patch("backend.simulation.process_model.init_temp_C", 22.0), \
-             patch("backend.simulation.process_model.init_room_CO2", 400.0), \
-             patch("backend.simulation.process_model.init_room_O2", 21.0), \
-             patch("backend.simulation.process_model.PID") as mock_pid, \
-             patch("backend.simulation.process_model.use_hvac"), \
-             patch("backend.simulation.process_model.simulate_airsealed_room_no_control"), \
-             patch("backend.simulation.process_model.simulate_airsealed_room_with_control"), \
-             patch("backend.simulation.process_model.write_json"), \
-             patch("backend.simulation.process_model.time_list", []), \
-             patch("backend.simulation.process_model.temp_list", []), \
-             patch("backend.simulation.process_model.co2_list", []), \
-             patch("backend.simulation.process_model.o2_list", []), \
-             patch("backend.simulation.process_model.thermal_list", []):
-            
-            mock_config.__getitem__.return_value = {
-                "pid_constants": {
-                    "temp_k": [1.0, 0.1, 0.01],
-                    "co2_k": [1.0, 0.1, 0.01],
-                    "o2_k": [1.0, 0.1, 0.01]
-                }
-            }
-            
-            mock_pid.return_value = MagicMock()
-            
-            try:
-                process_for_sql()
-                # Should create PIDs
-                assert mock_pid.called
-            except:
-                pass
-
-    def test_process_for_sql_uses_hvac_control(self):
-        """
-        Tests that process_for_sql uses HVAC control (use_hvac function).
-        """
-        with patch("backend.simulation.process_model.config") as mock_config, \
-             patch("backend.simulation.process_model.hours_run", 1), \
-             patch("backend.simulation.process_model.start_time", datetime.now()), \
-             patch("backend.simulation.process_model.init_temp_C", 22.0), \
-             patch("backend.simulation.process_model.init_room_CO2", 400.0), \
-             patch("backend.simulation.process_model.init_room_O2", 21.0), \
-             patch("backend.simulation.process_model.PID"), \
-             patch("backend.simulation.process_model.use_hvac") as mock_hvac, \
-             patch("backend.simulation.process_model.simulate_airsealed_room_no_control") as mock_sim_no_control, \
-             patch("backend.simulation.process_model.simulate_airsealed_room_with_control"), \
-             patch("backend.simulation.process_model.write_json"), \
-             patch("backend.simulation.process_model.time_list", []), \
-             patch("backend.simulation.process_model.temp_list", []), \
-             patch("backend.simulation.process_model.co2_list", []), \
-             patch("backend.simulation.process_model.o2_list", []), \
-             patch("backend.simulation.process_model.thermal_list", []):
-            
-            mock_config.__getitem__.return_value = {
-                "pid_constants": {
-                    "temp_k": [1.0, 0.1, 0.01],
-                    "co2_k": [1.0, 0.1, 0.01],
-                    "o2_k": [1.0, 0.1, 0.01]
-                }
-            }
-            
-            mock_sim_no_control.return_value = [datetime.now(), 22.0, 400.0, 21.0, 5000.0]
-            mock_hvac.return_value = ([0.5, -5.0, 0.2], MagicMock(), MagicMock(), MagicMock())
-            
-            try:
-                process_for_sql()
-                # Should have called use_hvac
-                assert mock_hvac.called
-            except:
-                pass
-
-    def test_process_for_sql_calls_write_json(self):
-        """
-        Tests that process_for_sql calls write_json.
-        """
-        with patch("backend.simulation.process_model.config") as mock_config, \
-             patch("backend.simulation.process_model.hours_run", 1), \
-             patch("backend.simulation.process_model.start_time", datetime.now()), \
-             patch("backend.simulation.process_model.init_temp_C", 22.0), \
-             patch("backend.simulation.process_model.init_room_CO2", 400.0), \
-             patch("backend.simulation.process_model.init_room_O2", 21.0), \
-             patch("backend.simulation.process_model.PID"), \
-             patch("backend.simulation.process_model.use_hvac") as mock_hvac, \
-             patch("backend.simulation.process_model.simulate_airsealed_room_no_control") as mock_sim_no_control, \
-             patch("backend.simulation.process_model.simulate_airsealed_room_with_control") as mock_sim_control, \
-             patch("backend.simulation.process_model.write_json") as mock_write, \
-             patch("backend.simulation.process_model.time_list", []), \
-             patch("backend.simulation.process_model.temp_list", []), \
-             patch("backend.simulation.process_model.co2_list", []), \
-             patch("backend.simulation.process_model.o2_list", []), \
-             patch("backend.simulation.process_model.thermal_list", []):
-            
-            mock_config.__getitem__.return_value = {
-                "pid_constants": {
-                    "temp_k": [1.0, 0.1, 0.01],
-                    "co2_k": [1.0, 0.1, 0.01],
-                    "o2_k": [1.0, 0.1, 0.01]
-                }
-            }
-            
-            test_data = [datetime.now(), 22.0, 400.0, 21.0, 5000.0]
-            mock_sim_no_control.return_value = test_data
-            mock_sim_control.return_value = test_data
-            mock_hvac.return_value = ([0.5, -5.0, 0.2], MagicMock(), MagicMock(), MagicMock())
-            
-            try:
-                process_for_sql()
-                # Should have called write_json
-                assert mock_write.called
-            except:
-                pass
-
-    def test_process_for_sql_with_pid_constants(self):
-        """
-        Tests that process_for_sql reads PID constants from config.
-        """
-        with patch("backend.simulation.process_model.config") as mock_config, \
-             patch("backend.simulation.process_model.hours_run", 1), \
-             patch("backend.simulation.process_model.start_time", datetime.now()), \
-             patch("backend.simulation.process_model.init_temp_C", 22.0), \
-             patch("backend.simulation.process_model.init_room_CO2", 400.0), \
-             patch("backend.simulation.process_model.init_room_O2", 21.0), \
-             patch("backend.simulation.process_model.PID") as mock_pid, \
-             patch("backend.simulation.process_model.use_hvac"), \
-             patch("backend.simulation.process_model.simulate_airsealed_room_no_control"), \
-             patch("backend.simulation.process_model.simulate_airsealed_room_with_control"), \
-             patch("backend.simulation.process_model.write_json"), \
-             patch("backend.simulation.process_model.time_list", []), \
-             patch("backend.simulation.process_model.temp_list", []), \
-             patch("backend.simulation.process_model.co2_list", []), \
-             patch("backend.simulation.process_model.o2_list", []), \
-             patch("backend.simulation.process_model.thermal_list", []):
-            
-            mock_config.__getitem__.return_value = {
-                "pid_constants": {
-                    "temp_k": [2.0, 0.5, 0.2],
-                    "co2_k": [1.5, 0.3, 0.15],
-                    "o2_k": [1.2, 0.2, 0.1]
-                }
-            }
-            
-            mock_pid.return_value = MagicMock()
-            
-            try:
-                process_for_sql()
-                # Should have called PID with correct constants
-                assert mock_pid.called
-            except:
-                pass
+import matplotlib
+matplotlib.use('Agg')  # Use non-GUI backend
+
+from datetime import datetime, timedelta
+from unittest.mock import patch, MagicMock
+
+from backend.simulation.process_model import plot_data, process_for_dataframe, process_for_sql
+
+
+class TestPlotData:
+    """Tests for the plot_data function."""
+
+    def test_plot_data_creates_figure(self):
+        """
+        Tests that plot_data creates a matplotlib figure.
+        """
+        time_list = [datetime.now() + timedelta(minutes=i) for i in range(5)]
+        temp_list = [20.0 + i for i in range(5)]
+        co2_list = [400.0 + i*5 for i in range(5)]
+        o2_list = [21.0 + i*0.1 for i in range(5)]
+        thermal_list = [5000.0 + i*100 for i in range(5)]
+        
+        with patch("backend.simulation.process_model.process_for_dataframe"), \
+             patch("matplotlib.pyplot.show"):
+            plot_data(time_list, temp_list, co2_list, o2_list, thermal_list)
+        
+        # If we get here without error, function worked
+        assert True
+
+    def test_plot_data_with_empty_lists(self):
+        """
+        Tests plot_data with empty data lists.
+        """
+        with patch("backend.simulation.process_model.process_for_dataframe"), \
+             patch("matplotlib.pyplot.show"):
+            plot_data([], [], [], [], [])
+        
+        assert True
+
+    def test_plot_data_with_single_point(self):
+        """
+        Tests plot_data with single data point.
+        """
+        time_list = [datetime.now()]
+        temp_list = [22.0]
+        co2_list = [400.0]
+        o2_list = [21.0]
+        thermal_list = [5000.0]
+        
+        with patch("backend.simulation.process_model.process_for_dataframe"), \
+             patch("matplotlib.pyplot.show"):
+            plot_data(time_list, temp_list, co2_list, o2_list, thermal_list)
+        
+        assert True
+
+    def test_plot_data_with_many_points(self):
+        """
+        Tests plot_data with many data points.
+        """
+        n = 1000
+        time_list = [datetime.now() + timedelta(minutes=i) for i in range(n)]
+        temp_list = [20.0 + (i % 5) for i in range(n)]
+        co2_list = [400.0 + (i % 100) for i in range(n)]
+        o2_list = [21.0 + (i % 2) * 0.1 for i in range(n)]
+        thermal_list = [5000.0 + (i % 500) for i in range(n)]
+        
+        with patch("backend.simulation.process_model.process_for_dataframe"), \
+             patch("matplotlib.pyplot.show"):
+            plot_data(time_list, temp_list, co2_list, o2_list, thermal_list)
+        
+        assert True
+
+    def test_plot_data_calls_process_for_dataframe(self):
+        """
+        Tests that plot_data calls process_for_dataframe.
+        """
+        time_list = [datetime.now()]
+        temp_list = [22.0]
+        co2_list = [400.0]
+        o2_list = [21.0]
+        thermal_list = [5000.0]
+        
+        with patch("backend.simulation.process_model.process_for_dataframe") as mock_process, \
+             patch("matplotlib.pyplot.show"):
+            plot_data(time_list, temp_list, co2_list, o2_list, thermal_list)
+            
+            mock_process.assert_called_once()
+
+    def test_plot_data_calls_show(self):
+        """
+        Tests that plot_data calls pyplot.show().
+        """
+        time_list = [datetime.now()]
+        temp_list = [22.0]
+        co2_list = [400.0]
+        o2_list = [21.0]
+        thermal_list = [5000.0]
+        
+        with patch("backend.simulation.process_model.process_for_dataframe"), \
+             patch("matplotlib.pyplot.show") as mock_show:
+            plot_data(time_list, temp_list, co2_list, o2_list, thermal_list)
+            
+            mock_show.assert_called_once()
+
+    def test_plot_data_with_negative_values(self):
+        """
+        Tests plot_data with negative values in data.
+        """
+        time_list = [datetime.now() + timedelta(minutes=i) for i in range(3)]
+        temp_list = [-10.0, 0.0, 10.0]
+        co2_list = [-100.0, 400.0, 500.0]
+        o2_list = [-5.0, 21.0, 30.0]
+        thermal_list = [-1000.0, 5000.0, 10000.0]
+        
+        with patch("backend.simulation.process_model.process_for_dataframe"), \
+             patch("matplotlib.pyplot.show"):
+            plot_data(time_list, temp_list, co2_list, o2_list, thermal_list)
+        
+        assert True
+
+    def test_plot_data_with_large_values(self):
+        """
+        Tests plot_data with large numeric values.
+        """
+        time_list = [datetime.now()]
+        temp_list = [1000.0]
+        co2_list = [1000000.0]
+        o2_list = [1000000.0]
+        thermal_list = [999999.0]
+        
+        with patch("backend.simulation.process_model.process_for_dataframe"), \
+             patch("matplotlib.pyplot.show"):
+            plot_data(time_list, temp_list, co2_list, o2_list, thermal_list)
+        
+        assert True
+
+    def test_plot_data_mismatched_lengths(self):
+        """
+        Tests plot_data with mismatched list lengths.
+        This may cause matplotlib errors which is expected behavior.
+        """
+        time_list = [datetime.now()]
+        temp_list = [20.0, 21.0]  # Different length
+        co2_list = [400.0]
+        o2_list = [21.0]
+        thermal_list = [5000.0]
+        
+        # May raise or handle gracefully depending on matplotlib
+        with patch("backend.simulation.process_model.process_for_dataframe"), \
+             patch("matplotlib.pyplot.show"):
+            try:
+                plot_data(time_list, temp_list, co2_list, o2_list, thermal_list)
+            except (ValueError, IndexError):
+                pass  # Expected for mismatched lengths
+
+
+class TestProcessForDataframe:
+    """Tests for the process_for_dataframe function."""
+
+    @staticmethod
+    def _batch_result(n):
+        """
+        Builds the five per-column lists the batch simulation returns.
+        """
+        return (
+            [datetime.now() for _ in range(n)],
+            [22.0 + i for i in range(n)],
+            [400.0 + i for i in range(n)],
+            [21.0 - i * 0.1 for i in range(n)],
+            [5000.0 + i for i in range(n)],
+        )
+
+    def test_process_for_dataframe_generates_data(self):
+        """
+        Tests that process_for_dataframe generates simulation data.
+        """
+        with patch("backend.simulation.process_model.hours_run", 1), \
+             patch("backend.simulation.process_model.simulate_airsealed_room_no_control_batch",
+                   return_value=self._batch_result(2)), \
+             patch("backend.simulation.process_model.open_jsonl"), \
+             patch("backend.simulation.process_model.write_row_jsonl"), \
+             patch("backend.simulation.process_model.plot_data"), \
+             patch("backend.simulation.process_model.time_list", []), \
+             patch("backend.simulation.process_model.temp_list", []), \
+             patch("backend.simulation.process_model.co2_list", []), \
+             patch("backend.simulation.process_model.o2_list", []), \
+             patch("backend.simulation.process_model.thermal_list", []):
+            
+            # Function should not raise
+            process_for_dataframe()
+
+    def test_process_for_dataframe_calls_simulate(self):
+        """
+        Tests that process_for_dataframe runs the batch simulation.
+        """
+        with patch("backend.simulation.process_model.hours_run", 1), \
+             patch("backend.simulation.process_model.simulate_airsealed_room_no_control_batch") as mock_sim, \
+             patch("backend.simulation.process_model.open_jsonl"), \
+             patch("backend.simulation.process_model.write_row_jsonl"), \
+             patch("backend.simulation.process_model.plot_data"), \
+             patch("backend.simulation.process_model.time_list", []), \
+             patch("backend.simulation.process_model.temp_list", []), \
+             patch("backend.simulation.process_model.co2_list", []), \
+             patch("backend.simulation.process_model.o2_list", []), \
+             patch("backend.simulation.process_model.thermal_list", []):
+            
+            mock_sim.return_value = self._batch_result(60)
+            
+            process_for_dataframe()
+            
+            # One batched call covers the whole hours_run*60 run
+            mock_sim.assert_called_once()
+            assert mock_sim.call_args[0][1] == 60
+
+    def test_process_for_dataframe_writes_jsonl_rows(self):
+        """
+        Tests that process_for_dataframe writes one JSONL row per step.
+        """
+        with patch("backend.simulation.process_model.hours_run", 2), \
+             patch("backend.simulation.process_model.simulate_airsealed_room_no_control_batch",
+                   return_value=self._batch_result(120)), \
+             patch("backend.simulation.process_model.open_jsonl") as mock_open, \
+             patch("backend.simulation.process_model.write_row_jsonl") as mock_write, \
+             patch("backend.simulation.process_model.plot_data"), \
+             patch("backend.simulation.process_model.time_list", []), \
+             patch("backend.simulation.process_model.temp_list", []), \
+             patch("backend.simulation.process_model.co2_list", []), \
+             patch("backend.simulation.process_model.o2_list", []), \
+             patch("backend.simulation.process_model.thermal_list", []):
+            
+            process_for_dataframe()
+            
+            # One file handle, one row appended per simulated minute
+            mock_open.assert_called_once()
+            assert mock_write.call_count == 120
+
+
+class TestProcessForSql:
+    """Tests for the process_for_sql function."""
+
+    def test_process_for_sql_creates_pids(self):
+        """
+        Tests that process_for_sql initializes PID controllers.
+        """
+        with patch("backend.simulation.process_model.config") as mock_config, \
+             patch("backend.simulation.process_model.hours_run", 1), \
+             patch("backend.simulation.process_model.start_time", datetime.now()), \
+             patch("backend.simulation.process_model.init_temp_C", 22.0), \
+             patch("backend.simulation.process_model.init_room_CO2", 400.0), \
+             patch("backend.simulation.process_model.init_room_O2", 21.0), \
+             patch("backend.simulation.process_model.PID") as mock_pid, \
+             patch("backend.simulation.process_model.use_hvac"), \
+             patch("backend.simulation.process_model.simulate_airsealed_room_no_control"), \
+             patch("backend.simulation.process_model.simulate_airsealed_room_with_control"), \
+             patch("backend.simulation.process_model.write_json"), \
+             patch("backend.simulation.process_model.generate_table"), \
+             patch("backend.simulation.process_model.insert_many"), \
+             patch("backend.simulation.process_model.time_list", []), \
+             patch("backend.simulation.process_model.temp_list", []), \
+             patch("backend.simulation.process_model.co2_list", []), \
+             patch("backend.simulation.process_model.o2_list", []), \
+             patch("backend.simulation.process_model.thermal_list", []):
+            
+            mock_config.__getitem__.return_value = {
+                "pid_constants": {
+                    "temp_k": [1.0, 0.1, 0.01],
+                    "co2_k": [1.0, 0.1, 0.01],
+                    "o2_k": [1.0, 0.1, 0.01]
+                }
+            }
+            
+            mock_pid.return_value = MagicMock()
+            
+            try:
+                process_for_sql()
+                # Should create PIDs
+                assert mock_pid.called
+            except:
+                pass
+
+    def test_process_for_sql_uses_hvac_control(self):
+        """
+        Tests that process_for_sql uses HVAC control (use_hvac function).
+        """
+        with patch("backend.simulation.process_model.config") as mock_config, \
+             patch("backend.simulation.process_model.hours_run", 1), \
+             patch("backend.simulation.process_model.start_time", datetime.now()), \
+             patch("backend.simulation.process_model.init_temp_C", 22.0), \
+             patch("backend.simulation.process_model.init_room_CO2", 400.0), \
+             patch("backend.simulation.process_model.init_room_O2", 21.0), \
+             patch("backend.simulation.process_model.PID"), \
+             patch("backend.simulation.process_model.use_hvac") as mock_hvac, \
+             patch("backend.simulation.process_model.simulate_airsealed_room_no_control") as mock_sim_no_control, \
+             patch("backend.simulation.process_model.simulate_airsealed_room_with_control"), \
+             patch("backend.simulation.process_model.write_json"), \
+             patch("backend.simulation.process_model.generate_table"), \
+             patch("backend.simulation.process_model.insert_many"), \
+             patch("backend.simulation.process_model.time_list", []), \
+             patch("backend.simulation.process_model.temp_list", []), \
+             patch("backend.simulation.process_model.co2_list", []), \
+             patch("backend.simulation.process_model.o2_list", []), \
+             patch("backend.simulation.process_model.thermal_list", []):
+            
+            mock_config.__getitem__.return_value = {
+                "pid_constants": {
+                    "temp_k": [1.0, 0.1, 0.01],
+                    "co2_k": [1.0, 0.1, 0.01],
+                    "o2_k": [1.0, 0.1, 0.01]
+                }
+            }
+            
+            mock_sim_no_control.return_value = [datetime.now(), 22.0, 400.0, 21.0, 5000.0]
+            mock_hvac.return_value = ([0.5, -5.0, 0.2], MagicMock(), MagicMock(), MagicMock())
+            
+            try:
+                process_for_sql()
+                # Should have called use_hvac
+                assert mock_hvac.called
+            except:
+                pass
+
+    def test_process_for_sql_calls_write_json(self):
+        """
+        Tests that process_for_sql calls write_json.
+        """
+        with patch("backend.simulation.process_model.config") as mock_config, \
+             patch("backend.simulation.process_model.hours_run", 1), \
+             patch("backend.simulation.process_model.start_time", datetime.now()), \
+             patch("backend.simulation.process_model.init_temp_C", 22.0), \
+             patch("backend.simulation.process_model.init_room_CO2", 400.0), \
+             patch("backend.simulation.process_model.init_room_O2", 21.0), \
+             patch("backend.simulation.process_model.PID"), \
+             patch("backend.simulation.process_model.use_hvac") as mock_hvac, \
+             patch("backend.simulation.process_model.simulate_airsealed_room_no_control") as mock_sim_no_control, \
+             patch("backend.simulation.process_model.simulate_airsealed_room_with_control") as mock_sim_control, \
+             patch("backend.simulation.process_model.write_json") as mock_write, \
+             patch("backend.simulation.process_model.generate_table"), \
+             patch("backend.simulation.process_model.insert_many"), \
+             patch("backend.simulation.process_model.time_list", []), \
+             patch("backend.simulation.process_model.temp_list", []), \
+             patch("backend.simulation.process_model.co2_list", []), \
+             patch("backend.simulation.process_model.o2_list", []), \
+             patch("backend.simulation.process_model.thermal_list", []):
+            
+            mock_config.__getitem__.return_value = {
+                "pid_constants": {
+                    "temp_k": [1.0, 0.1, 0.01],
+                    "co2_k": [1.0, 0.1, 0.01],
+                    "o2_k": [1.0, 0.1, 0.01]
+                }
+            }
+            
+            test_data = [datetime.now(), 22.0, 400.0, 21.0, 5000.0]
+            mock_sim_no_control.return_value = test_data
+            mock_sim_control.return_value = test_data
+            mock_hvac.return_value = ([0.5, -5.0, 0.2], MagicMock(), MagicMock(), MagicMock())
+            
+            try:
+                process_for_sql()
+                # Should have called write_json
+                assert mock_write.called
+            except:
+                pass
+
+    def test_process_for_sql_with_pid_constants(self):
+        """
+        Tests that process_for_sql reads PID constants from config.
+        """
+        with patch("backend.simulation.process_model.config") as mock_config, \
+             patch("backend.simulation.process_model.hours_run", 1), \
+             patch("backend.simulation.process_model.start_time", datetime.now()), \
+             patch("backend.simulation.process_model.init_temp_C", 22.0), \
+             patch("backend.simulation.process_model.init_room_CO2", 400.0), \
+             patch("backend.simulation.process_model.init_room_O2", 21.0), \
+             patch("backend.simulation.process_model.PID") as mock_pid, \
+             patch("backend.simulation.process_model.use_hvac"), \
+             patch("backend.simulation.process_model.simulate_airsealed_room_no_control"), \
+             patch("backend.simulation.process_model.simulate_airsealed_room_with_control"), \
+             patch("backend.simulation.process_model.write_json"), \
+             patch("backend.simulation.process_model.generate_table"), \
+             patch("backend.simulation.process_model.insert_many"), \
+             patch("backend.simulation.process_model.time_list", []), \
+             patch("backend.simulation.process_model.temp_list", []), \
+             patch("backend.simulation.process_model.co2_list", []), \
+             patch("backend.simulation.process_model.o2_list", []), \
+             patch("backend.simulation.process_model.thermal_list", []):
+            
+            mock_config.__getitem__.return_value = {
+                "pid_constants": {
+                    "temp_k": [2.0, 0.5, 0.2],
+                    "co2_k": [1.5, 0.3, 0.15],
+                    "o2_k": [1.2, 0.2, 0.1]
+                }
+            }
+            
+            mock_pid.return_value = MagicMock()
+            
+            try:
+                process_for_sql()
+                # Should have called PID with correct constants
+                assert mock_pid.called
+            except:
+                pass